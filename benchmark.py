@@ -21,12 +21,15 @@ from __future__ import annotations
 
 import argparse
 import json
+import os
 import platform
 import subprocess
 import sys
 import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import asdict, dataclass, field
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
@@ -41,6 +44,22 @@ from tools import FGPBrowserTool, AgentBrowserTool, PlaywrightMCPTool
 from visualization import generate_all_charts
 from report import generate_markdown_report
 
+# tomllib is stdlib from Python 3.11; on 3.10 (the minimum supported)
+# the FGP version is read by scanning Cargo.toml's [package] table instead
+try:
+    import tomllib
+except ImportError:
+    tomllib = None
+
+# orjson is optional; it serializes the (large) raw result lists much faster
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+FGP_CARGO_TOML = Path.home() / "projects" / "fgp" / "browser" / "Cargo.toml"
+
 
 @dataclass
 class EnvironmentSpec:
@@ -70,36 +89,29 @@ class EnvironmentSpec:
             except Exception:
                 return "unknown"
 
-        # Get Chrome version
-        chrome_version = run_cmd(
-            ["/Applications/Google Chrome.app/Contents/MacOS/Google Chrome", "--version"]
-        ).replace("Google Chrome ", "")
-
-        # Get Node version
-        node_version = run_cmd(["node", "--version"]).lstrip("v")
-
-        # Get Rust version
-        rust_version = run_cmd(["rustc", "--version"]).replace("rustc ", "").split()[0]
-
-        # Get FGP version from Cargo.toml
-        fgp_version = "0.1.0"  # From published crate
-        try:
-            cargo_toml = Path.home() / "projects" / "fgp" / "browser" / "Cargo.toml"
-            if cargo_toml.exists():
-                for line in cargo_toml.read_text().split("\n"):
-                    if line.startswith("version"):
-                        fgp_version = line.split("=")[1].strip().strip('"')
-                        break
-        except Exception:
-            pass
-
-        # Get playwright version
-        playwright_version = run_cmd(["npx", "@playwright/mcp@latest", "--version"])
+        # Version probes are independent and I/O-bound (npx alone can take
+        # seconds), so run them concurrently: wall time is the slowest probe
+        # rather than the sum of all of them.
+        version_cmds = {
+            "chrome": ["/Applications/Google Chrome.app/Contents/MacOS/Google Chrome", "--version"],
+            "node": ["node", "--version"],
+            "rust": ["rustc", "--version"],
+            "playwright": ["npx", "@playwright/mcp@latest", "--version"],
+            "agent_browser": ["agent-browser", "--version"],
+        }
+        with ThreadPoolExecutor(max_workers=len(version_cmds)) as executor:
+            futures = {name: executor.submit(run_cmd, cmd) for name, cmd in version_cmds.items()}
+            versions = {name: future.result() for name, future in futures.items()}
+
+        chrome_version = versions["chrome"].replace("Google Chrome ", "")
+        node_version = versions["node"].lstrip("v")
+        rust_version = versions["rust"].replace("rustc ", "").split()[0]
+
+        playwright_version = versions["playwright"]
         if not playwright_version or playwright_version == "unknown":
             playwright_version = "latest"
 
-        # Get agent-browser version
-        agent_browser_version = run_cmd(["agent-browser", "--version"])
+        agent_browser_version = versions["agent_browser"]
         if not agent_browser_version or agent_browser_version == "unknown":
             agent_browser_version = "latest"
 
@@ -113,7 +125,7 @@ class EnvironmentSpec:
             node_version=node_version,
             rust_version=rust_version,
             python_version=platform.python_version(),
-            fgp_version=fgp_version,
+            fgp_version=_read_fgp_version(),
             playwright_version=playwright_version,
             agent_browser_version=agent_browser_version,
             network_type="Local (no throttling)",
@@ -121,6 +133,48 @@ class EnvironmentSpec:
         )
 
 
+def _scan_package_version(text: str) -> str | None:
+    """``version = "..."`` from a Cargo.toml's [package] table, without tomllib.
+
+    Only keys inside [package] are looked at, so ``version`` keys in
+    [dependencies] and other tables never match.
+    """
+    in_package = False
+    for line in text.splitlines():
+        line = line.strip()
+        if line.startswith("["):
+            in_package = line == "[package]"
+            continue
+        if not in_package:
+            continue
+        key, sep, value = line.partition("=")
+        if sep and key.strip() == "version":
+            value = value.strip()
+            # A quoted string; anything else (an inline table) isn't a version
+            return value.split('"')[1] if value.startswith('"') else None
+    return None
+
+
+@lru_cache(maxsize=1)
+def _read_fgp_version() -> str:
+    """Get FGP Browser version from its Cargo.toml [package] table."""
+    default = "0.1.0"  # From published crate
+    if not FGP_CARGO_TOML.exists():
+        return default
+    if tomllib is None:
+        try:
+            return _scan_package_version(FGP_CARGO_TOML.read_text()) or default
+        except OSError:
+            return default
+    try:
+        with open(FGP_CARGO_TOML, "rb") as f:
+            version = tomllib.load(f)["package"]["version"]
+    except (OSError, KeyError, tomllib.TOMLDecodeError):
+        return default
+    # Workspace crates declare `version.workspace = true` instead of a string
+    return version if isinstance(version, str) else default
+
+
 def _get_memory_gb() -> int:
     """Get system memory in GB."""
     try:
@@ -145,6 +199,9 @@ class BenchmarkConfig:
     outlier_sigma: float = 3.0
     significance_test: str = "mann-whitney-u"
     effect_size_metric: str = "cohens-d"
+    parallel_tools: int = 1  # Tools benchmarked concurrently (single_ops, workflows)
+    raw_log: str | None = None  # JSON Lines file single_ops/workflows append results to
+    mcp_persistent: bool = False  # Keep one Playwright MCP server alive instead of spawning per call
 
 
 @dataclass
@@ -163,25 +220,28 @@ class BenchmarkReport:
     summary: dict = field(default_factory=dict)
 
 
+def _dump_json(data: dict) -> bytes:
+    """Serialize results to indented JSON bytes."""
+    if HAS_ORJSON:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS, default=str)
+    return json.dumps(data, indent=2, default=str).encode()
+
+
 def run_all_benchmarks(
     config: BenchmarkConfig,
     suites: list[str] | None = None,
+    environment: Future[EnvironmentSpec] | None = None,
 ) -> BenchmarkReport:
-    """Run all benchmark suites."""
+    """Run all benchmark suites.
+
+    If ``environment`` is given, it is a pending capture started by the
+    caller; it is only waited on once the tools are initialized.
+    """
     report = BenchmarkReport(
         generated_at=datetime.now().isoformat(),
         config=config,
     )
 
-    # Capture environment
-    print("Capturing environment specifications...")
-    report.environment = EnvironmentSpec.capture()
-    print(f"  OS: {report.environment.os} {report.environment.os_version}")
-    print(f"  CPU: {report.environment.cpu} ({report.environment.cpu_cores} cores)")
-    print(f"  Memory: {report.environment.memory_gb} GB")
-    print(f"  Chrome: {report.environment.chrome_version}")
-    print()
-
     # Initialize tools
     print("Initializing browser tools...")
     tools = []
@@ -189,7 +249,7 @@ def run_all_benchmarks(
     fgp = FGPBrowserTool()
     if fgp.is_available():
         tools.append(fgp)
-        print(f"  [OK] FGP Browser v{report.environment.fgp_version}")
+        print(f"  [OK] FGP Browser v{_read_fgp_version()}")
     else:
         print("  [SKIP] FGP Browser not available")
 
@@ -200,15 +260,27 @@ def run_all_benchmarks(
     else:
         print("  [SKIP] agent-browser not available")
 
-    playwright = PlaywrightMCPTool()
+    playwright = PlaywrightMCPTool(persistent=config.mcp_persistent)
     if playwright.is_available():
         tools.append(playwright)
-        print(f"  [OK] Playwright MCP")
+        print(f"  [OK] Playwright MCP{' (persistent server)' if config.mcp_persistent else ''}")
     else:
         print("  [SKIP] Playwright MCP not available")
 
     print()
 
+    # Capture environment (usually already finished in the background)
+    print("Capturing environment specifications...")
+    if environment is None:
+        report.environment = EnvironmentSpec.capture()
+    else:
+        report.environment = environment.result()
+    print(f"  OS: {report.environment.os} {report.environment.os_version}")
+    print(f"  CPU: {report.environment.cpu} ({report.environment.cpu_cores} cores)")
+    print(f"  Memory: {report.environment.memory_gb} GB")
+    print(f"  Chrome: {report.environment.chrome_version}")
+    print()
+
     if not tools:
         print("ERROR: No browser tools available")
         return report
@@ -306,6 +378,26 @@ Examples:
         type=str,
         help="Output JSON file path"
     )
+    parser.add_argument(
+        "--parallel-tools",
+        type=int,
+        default=1,
+        metavar="N",
+        help="Run single-op and workflow benchmarks on up to N tools at once "
+             "(faster, but tools share CPU; default: 1)"
+    )
+    parser.add_argument(
+        "--raw-log",
+        type=str,
+        metavar="PATH",
+        help="Append single-op and workflow raw results to PATH (JSON Lines) as they are measured"
+    )
+    parser.add_argument(
+        "--mcp-persistent",
+        action="store_true",
+        help="Keep one Playwright MCP server running for all calls instead of "
+             "spawning it per call (the default, which matches stdio MCP usage)"
+    )
     parser.add_argument(
         "--no-charts",
         action="store_true",
@@ -313,10 +405,20 @@ Examples:
     )
     args = parser.parse_args()
 
+    # Environment capture shells out to several version commands; start it
+    # now so it overlaps tool initialization. Started only once the
+    # arguments parsed, so --help or a bad flag exits without spawning them.
+    env_executor = ThreadPoolExecutor(max_workers=1)
+    env_future = env_executor.submit(EnvironmentSpec.capture)
+    env_executor.shutdown(wait=False)
+
     # Configure
     config = BenchmarkConfig(
         min_iterations=5 if args.quick else args.iterations,
         warmup_iterations=1 if args.quick else args.warmup,
+        parallel_tools=max(1, args.parallel_tools),
+        raw_log=args.raw_log,
+        mcp_persistent=args.mcp_persistent,
     )
 
     suites = None if args.suite == "all" else [args.suite]
@@ -331,15 +433,15 @@ Examples:
     print()
 
     # Run benchmarks
-    report = run_all_benchmarks(config, suites)
+    report = run_all_benchmarks(config, suites, environment=env_future)
 
-    # Generate charts
+    # Render charts in the background while the report and JSON are written.
+    # matplotlib isn't thread-safe across figures, so charts get one worker.
+    chart_executor = ThreadPoolExecutor(max_workers=1)
+    chart_future = None
     if not args.no_charts and report.single_ops:
-        print("Generating charts...")
-        chart_paths = generate_all_charts(report)
-        for path in chart_paths:
-            print(f"  Generated: {path}")
-        print()
+        print("Generating charts in the background...")
+        chart_future = chart_executor.submit(generate_all_charts, report)
 
     # Generate markdown report
     print("Generating report...")
@@ -372,17 +474,33 @@ Examples:
         "statistics": report.statistics,
     }
 
-    with open(output_path, "w") as f:
-        json.dump(report_dict, f, indent=2, default=str)
+    # Serialize once, write the same bytes to both files
+    payload = _dump_json(report_dict)
+
+    output_path.write_bytes(payload)
     print(f"  Saved: {output_path}")
 
-    # Also save as latest.json
+    # Also save as latest.json; a hard link avoids writing the bytes twice
     latest_path = results_dir / "latest.json"
-    with open(latest_path, "w") as f:
-        json.dump(report_dict, f, indent=2, default=str)
+    if latest_path.resolve() != output_path.resolve():
+        latest_path.unlink(missing_ok=True)
+        try:
+            os.link(output_path, latest_path)
+        except OSError:
+            # --output on another filesystem, or no hard link support
+            latest_path.write_bytes(payload)
     print(f"  Saved: {latest_path}")
-
     print()
+
+    # Collect charts
+    if chart_future is not None:
+        paths = chart_future.result()
+        print(f"Charts done ({len(paths)}):")
+        for path in paths:
+            print(f"  Generated: {path}")
+        print()
+    chart_executor.shutdown()
+
     print("=" * 60)
     print("BENCHMARK COMPLETE")
     print("=" * 60)
@@ -3,12 +3,12 @@
 from __future__ import annotations
 
 import asyncio
-import concurrent.futures
+import sys
 import time
 from dataclasses import dataclass
 from typing import Any
 
-from tools.base import BrowserTool
+from tools.base import BrowserTool, ms_since
 
 
 @dataclass
@@ -19,7 +19,7 @@ class ConcurrencyResult:
     total_time_ms: float
     requests_per_second: float
     success_rate: float
-    individual_times_ms: list[float]
+    individual_times_ms: list[float]  # Rounded to 0.1ms as recorded
 
 
 CONCURRENT_URLS = [
@@ -33,12 +33,30 @@ CONCURRENT_URLS = [
 
 def _run_single_request(tool: BrowserTool, url: str) -> tuple[bool, float]:
     """Run a single navigate request."""
-    start = time.perf_counter()
+    start = time.perf_counter_ns()
     result = tool.navigate(url)
-    elapsed = (time.perf_counter() - start) * 1000
+    elapsed = ms_since(start)
     return result.success, elapsed
 
 
+async def _run_single_request_async(tool: BrowserTool, url: str) -> tuple[bool, float]:
+    """Run a single navigate request without blocking the event loop.
+
+    No asyncio timeout here: it can't cancel the worker thread, which
+    asyncio.run() waits for anyway. A hung call is bounded by the tool's
+    own 60s call timeout and is reported as a failed result.
+    """
+    return await asyncio.to_thread(_run_single_request, tool, url)
+
+
+async def _gather_requests(tool: BrowserTool, urls: list[str]) -> list:
+    """Issue all navigate requests at once and wait for every one."""
+    return await asyncio.gather(
+        *(_run_single_request_async(tool, url) for url in urls),
+        return_exceptions=True,
+    )
+
+
 def test_concurrent_requests(
     tool: BrowserTool,
     parallel_count: int = 3,
@@ -51,27 +69,21 @@ def test_concurrent_requests(
     """
     urls = CONCURRENT_URLS[:parallel_count]
 
-    # Use ThreadPoolExecutor for parallel execution
-    start = time.perf_counter()
+    # Fan out on one event loop; the blocking tool calls run in worker threads
+    start = time.perf_counter_ns()
     results = []
     times = []
 
-    with concurrent.futures.ThreadPoolExecutor(max_workers=parallel_count) as executor:
-        futures = {
-            executor.submit(_run_single_request, tool, url): url
-            for url in urls
-        }
-
-        for future in concurrent.futures.as_completed(futures):
-            try:
-                success, elapsed = future.result(timeout=60)
-                results.append(success)
-                times.append(elapsed)
-            except Exception:
-                results.append(False)
-                times.append(0)
-
-    total_time = (time.perf_counter() - start) * 1000
+    for outcome in asyncio.run(_gather_requests(tool, urls)):
+        if isinstance(outcome, BaseException):
+            results.append(False)
+            times.append(0)
+        else:
+            success, elapsed = outcome
+            results.append(success)
+            times.append(round(elapsed, 1))
+
+    total_time = ms_since(start)
     success_rate = sum(results) / len(results) if results else 0
     rps = parallel_count / (total_time / 1000) if total_time > 0 else 0
 
@@ -99,7 +111,10 @@ def run_concurrency_benchmark(tools: list[BrowserTool]) -> dict:
         results["summaries"][tool.name] = {}
 
         for parallel_count in parallel_levels:
-            print(f"    {parallel_count} parallel requests...")
+            # Flushed before the test starts timing, so a slow level shows
+            # what it is waiting on
+            sys.stdout.write(f"    {parallel_count} parallel requests...\n")
+            sys.stdout.flush()
 
             # Run test
             result = test_concurrent_requests(tool, parallel_count)
@@ -109,13 +124,14 @@ def run_concurrency_benchmark(tools: list[BrowserTool]) -> dict:
                 "total_time_ms": round(result.total_time_ms, 1),
                 "requests_per_second": round(result.requests_per_second, 2),
                 "success_rate": round(result.success_rate * 100, 1),
-                "individual_times_ms": [round(t, 1) for t in result.individual_times_ms],
+                "individual_times_ms": result.individual_times_ms,
             }
 
-            print(f"      Total: {result.total_time_ms:.0f}ms, RPS: {result.requests_per_second:.1f}")
+            sys.stdout.write(f"      Total: {result.total_time_ms:.0f}ms, RPS: {result.requests_per_second:.1f}\n")
+            sys.stdout.flush()
 
-            # Brief pause
-            time.sleep(1)
+            # Short pause before the next level
+            tool.settle()
 
     # Build comparison
     for level in parallel_levels:
@@ -2,89 +2,115 @@
 
 from __future__ import annotations
 
-import time
+import sys
 from pathlib import Path
 from typing import Any
 
 from tools.base import BrowserTool
 
 
-# Feature test configurations
+UPLOAD_FILE = "/tmp/test_upload.txt"
+
+# Feature results are written to the terminal in batches of this many lines
+LOG_FLUSH_EVERY = 4
+
+
+# Feature test configurations. "url" is the page the test needs; every
+# other step is a (method, args, kwargs) call dispatched on the tool, so the
+# table is plain data built once at import.
 FEATURE_TESTS = {
     "navigate": {
-        "setup": None,
-        "test": lambda tool: tool.navigate("https://example.com"),
+        "url": None,
+        "setup": (),
+        "test": ("navigate", ("https://example.com",), {}),
         "expected": "page loads",
     },
     "snapshot": {
-        "setup": lambda tool: tool.navigate("https://example.com"),
-        "test": lambda tool: tool.snapshot(),
+        "url": "https://example.com",
+        "setup": (),
+        "test": ("snapshot", (), {}),
         "expected": "ARIA tree returned",
     },
     "screenshot": {
-        "setup": lambda tool: tool.navigate("https://example.com"),
-        "test": lambda tool: tool.screenshot("/tmp/feature_test_screenshot.png"),
+        "url": "https://example.com",
+        "setup": (),
+        "test": ("screenshot", ("/tmp/feature_test_screenshot.png",), {}),
         "expected": "PNG file created",
     },
     "click": {
-        "setup": lambda tool: tool.navigate("https://the-internet.herokuapp.com/checkboxes"),
-        "test": lambda tool: tool.click("input[type='checkbox']"),
+        "url": "https://the-internet.herokuapp.com/checkboxes",
+        "setup": (),
+        "test": ("click", ("input[type='checkbox']",), {}),
         "expected": "element clicked",
     },
     "fill": {
-        "setup": lambda tool: tool.navigate("https://the-internet.herokuapp.com/login"),
-        "test": lambda tool: tool.fill("input#username", "testuser"),
+        "url": "https://the-internet.herokuapp.com/login",
+        "setup": (),
+        "test": ("fill", ("input#username", "testuser"), {}),
         "expected": "input filled",
     },
     "select": {
-        "setup": lambda tool: tool.navigate("https://the-internet.herokuapp.com/dropdown"),
-        "test": lambda tool: tool.select("select#dropdown", "1"),
+        "url": "https://the-internet.herokuapp.com/dropdown",
+        "setup": (),
+        "test": ("select", ("select#dropdown", "1"), {}),
         "expected": "option selected",
     },
     "check": {
-        "setup": lambda tool: tool.navigate("https://the-internet.herokuapp.com/checkboxes"),
-        "test": lambda tool: tool.check("input[type='checkbox']"),
+        "url": "https://the-internet.herokuapp.com/checkboxes",
+        "setup": (),
+        "test": ("check", ("input[type='checkbox']",), {}),
         "expected": "checkbox checked",
     },
     "hover": {
-        "setup": lambda tool: tool.navigate("https://the-internet.herokuapp.com/hovers"),
-        "test": lambda tool: tool.hover("div.figure"),
+        "url": "https://the-internet.herokuapp.com/hovers",
+        "setup": (),
+        "test": ("hover", ("div.figure",), {}),
         "expected": "element hovered",
     },
     "scroll": {
-        "setup": lambda tool: tool.navigate("https://the-internet.herokuapp.com/infinite_scroll"),
-        "test": lambda tool: tool.scroll(y=500),
+        "url": "https://the-internet.herokuapp.com/infinite_scroll",
+        "setup": (),
+        "test": ("scroll", (), {"y": 500}),
         "expected": "page scrolled",
     },
     "press": {
-        "setup": lambda tool: tool.navigate("https://the-internet.herokuapp.com/key_presses"),
-        "test": lambda tool: tool.press("Enter"),
+        "url": "https://the-internet.herokuapp.com/key_presses",
+        "setup": (),
+        "test": ("press", ("Enter",), {}),
         "expected": "key pressed",
     },
     "press_combo": {
-        "setup": lambda tool: tool.navigate("https://the-internet.herokuapp.com/inputs"),
-        "test": lambda tool: (
-            tool.fill("input[type='number']", "12345"),
-            tool.press_combo(["Control"], "a"),
-        )[-1],  # Return last result
+        "url": "https://the-internet.herokuapp.com/inputs",
+        "setup": (("fill", ("input[type='number']", "12345"), {}),),
+        "test": ("press_combo", (["Control"], "a"), {}),
         "expected": "text selected",
     },
     "upload": {
-        "setup": lambda tool: _setup_upload_test(tool),
-        "test": lambda tool: tool.upload("input#file-upload", "/tmp/test_upload.txt"),
+        "url": "https://the-internet.herokuapp.com/upload",
+        "setup": (),
+        "test": ("upload", ("input#file-upload", UPLOAD_FILE), {}),
         "expected": "file uploaded",
     },
 }
 
 
-def _setup_upload_test(tool: BrowserTool) -> None:
-    """Setup for upload test - create test file and navigate."""
-    # Create test file
-    test_file = Path("/tmp/test_upload.txt")
-    test_file.write_text("This is a test file for upload benchmark.")
+def _invoke(tool: BrowserTool, call: tuple) -> Any:
+    """Dispatch a (method, args, kwargs) step on the tool."""
+    method, args, kwargs = call
+    return getattr(tool, method)(*args, **kwargs)
+
+
+def _create_upload_file() -> None:
+    """Create the file used by the upload test."""
+    Path(UPLOAD_FILE).write_text("This is a test file for upload benchmark.")
+
 
-    # Navigate to upload page
-    tool.navigate("https://the-internet.herokuapp.com/upload")
+def _flush_log(lines: list[str]) -> None:
+    """Write buffered progress lines in a single call and clear the buffer."""
+    if lines:
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
+        lines.clear()
 
 
 def run_feature_parity_test(tools: list[BrowserTool]) -> dict:
@@ -95,40 +121,66 @@ def run_feature_parity_test(tools: list[BrowserTool]) -> dict:
         "details": {},
     }
 
+    _create_upload_file()
+
     for tool in tools:
         print(f"  [{tool.name}]")
         results["matrix"][tool.name] = {}
         results["details"][tool.name] = {}
 
+        # tool.current_url lets consecutive tests that need the same URL
+        # skip a redundant navigation. Other suites may have moved the
+        # browser since, so only page state recorded here is trusted.
+        tool.current_url = None
+        log: list[str] = []
+
         for feature_name, config in FEATURE_TESTS.items():
-            print(f"    {feature_name}...", end=" ")
+            prefix = f"    {feature_name}..."
 
             try:
+                url = config["url"]
+                needs_nav = url is not None and url != tool.current_url
+
                 # Run setup if needed
-                if config["setup"]:
-                    config["setup"](tool)
-                    time.sleep(0.3)
+                if needs_nav or config["setup"]:
+                    if needs_nav:
+                        tool.current_url = url if tool.navigate(url).success else None
+                    for call in config["setup"]:
+                        _invoke(tool, call)
+                    # Give scripts on the freshly set-up page time to run
+                    # before hover/click tests interact with it
+                    tool.settle(0.3)
 
                 # Run test
-                result = config["test"](tool)
+                method, args, _ = config["test"]
+                result = _invoke(tool, config["test"])
+                if method == "navigate":
+                    tool.current_url = args[0] if result.success else None
 
                 if result.success:
                     results["matrix"][tool.name][feature_name] = "OK"
-                    print("OK")
+                    log.append(f"{prefix} OK")
                 else:
                     results["matrix"][tool.name][feature_name] = "FAIL"
                     results["details"][tool.name][feature_name] = result.error
-                    print(f"FAIL: {result.error}")
+                    log.append(f"{prefix} FAIL: {result.error}")
 
             except NotImplementedError:
+                tool.current_url = None
                 results["matrix"][tool.name][feature_name] = "N/A"
-                print("N/A (not implemented)")
+                log.append(f"{prefix} N/A (not implemented)")
             except Exception as e:
+                tool.current_url = None
                 results["matrix"][tool.name][feature_name] = "ERROR"
                 results["details"][tool.name][feature_name] = str(e)[:200]
-                print(f"ERROR: {str(e)[:50]}")
+                log.append(f"{prefix} ERROR: {str(e)[:50]}")
+
+            if len(log) >= LOG_FLUSH_EVERY:
+                _flush_log(log)
+
+            tool.settle()
 
-            time.sleep(0.5)
+        _flush_log(log)
 
     # Compute summary
     results["summary"] = {}
@@ -0,0 +1,43 @@
+"""Streaming raw results to a JSON Lines file."""
+
+from __future__ import annotations
+
+import json
+import threading
+
+# orjson is optional; it is noticeably faster for per-row dumps
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+
+def _dumps_line(row: dict) -> bytes:
+    """Serialize one row as a JSON line."""
+    if HAS_ORJSON:
+        return orjson.dumps(row, default=str) + b"\n"
+    return (json.dumps(row, default=str) + "\n").encode()
+
+
+class RawResultStream:
+    """Append raw result rows to a JSON Lines file as they are produced.
+
+    Lets long runs be followed (``tail -f``) and keeps measurements on disk
+    if a run dies before the report is written. Safe to share between
+    threads.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._fp = open(path, "ab")
+        self._lock = threading.Lock()
+
+    def write(self, rows: list[dict]) -> None:
+        data = b"".join(_dumps_line(row) for row in rows)
+        with self._lock:
+            self._fp.write(data)
+            self._fp.flush()
+
+    def close(self) -> None:
+        self._fp.close()
@@ -2,21 +2,28 @@
 
 from __future__ import annotations
 
-import subprocess
+import threading
 import time
-from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from statistics import fmean
 from typing import Any
 
+import psutil
+
 from tools.base import BrowserTool
 
 
+# How long run_resource_benchmark keeps sampling after the workload
+MONITOR_WINDOW_SECONDS = 5
+
+
 @dataclass
-class ResourceSample:
-    """Single resource usage sample."""
-    timestamp: float
-    cpu_percent: float
-    memory_mb: float
-    threads: int
+class ResourceSamples:
+    """Resource usage samples for one process, stored column-wise."""
+    cpu_percent: list[float] = field(default_factory=list)
+    memory_mb: list[float] = field(default_factory=list)
+    threads: list[int] = field(default_factory=list)
 
 
 @dataclass
@@ -31,34 +38,93 @@ class ResourceSummary:
     thread_count: int
 
 
-def _get_process_stats(pid: int) -> tuple[float, float, int] | None:
-    """Get CPU%, memory MB, thread count for a process."""
-    try:
-        # Use ps on macOS/Linux
-        result = subprocess.run(
-            ["ps", "-p", str(pid), "-o", "%cpu,%mem,rss,nlwp"],
-            capture_output=True,
-            text=True,
-        )
-        if result.returncode != 0:
-            return None
+def _empty_summary(tool_name: str) -> ResourceSummary:
+    return ResourceSummary(
+        tool=tool_name,
+        samples=0,
+        peak_memory_mb=0,
+        avg_memory_mb=0,
+        peak_cpu_percent=0,
+        avg_cpu_percent=0,
+        thread_count=0,
+    )
+
 
-        lines = result.stdout.strip().split("\n")
-        if len(lines) < 2:
-            return None
+def _summarize(tool_name: str, samples: ResourceSamples) -> ResourceSummary:
+    """Reduce a sample stream to peak/average figures."""
+    if not samples.memory_mb:
+        return _empty_summary(tool_name)
 
-        parts = lines[1].split()
-        if len(parts) < 3:
-            return None
+    # Each column is a flat list of floats, so these reductions run in C
+    return ResourceSummary(
+        tool=tool_name,
+        samples=len(samples.memory_mb),
+        peak_memory_mb=max(samples.memory_mb),
+        avg_memory_mb=fmean(samples.memory_mb),
+        peak_cpu_percent=max(samples.cpu_percent),
+        avg_cpu_percent=fmean(samples.cpu_percent),
+        thread_count=samples.threads[-1],
+    )
 
-        cpu_percent = float(parts[0])
-        memory_kb = int(parts[2])
-        memory_mb = memory_kb / 1024
-        threads = int(parts[3]) if len(parts) > 3 else 1
 
-        return cpu_percent, memory_mb, threads
-    except Exception:
-        return None
+class ResourceMonitor:
+    """Background sampler for several processes at once.
+
+    A single daemon thread polls every PID on each tick, so monitoring K
+    tools costs one sampling loop instead of K sequential windows.
+    """
+
+    def __init__(self, pids: dict[str, int], sample_interval: float = 0.5):
+        self.sample_interval = sample_interval
+        self._procs: dict[str, psutil.Process] = {}
+        self._samples = {name: ResourceSamples() for name in pids}
+        self._stop_event = threading.Event()
+        self._thread: threading.Thread | None = None
+
+        for name, pid in pids.items():
+            try:
+                self._procs[name] = psutil.Process(pid)
+            except psutil.Error:
+                pass
+
+    def start(self) -> None:
+        """Start sampling in the background."""
+        for proc in self._procs.values():
+            try:
+                # First cpu_percent() call always returns 0.0; prime it
+                proc.cpu_percent(interval=None)
+            except psutil.Error:
+                pass
+
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name="resource-monitor", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> dict[str, ResourceSummary]:
+        """Stop sampling and return a summary per monitored tool."""
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+        return {name: _summarize(name, samples) for name, samples in self._samples.items()}
+
+    def _run(self) -> None:
+        while not self._stop_event.wait(self.sample_interval):
+            for name, proc in list(self._procs.items()):
+                try:
+                    with proc.oneshot():
+                        cpu = proc.cpu_percent(interval=None)
+                        memory_mb = proc.memory_info().rss / (1024 * 1024)
+                        threads = proc.num_threads()
+                    samples = self._samples[name]
+                    samples.cpu_percent.append(cpu)
+                    samples.memory_mb.append(memory_mb)
+                    samples.threads.append(threads)
+                except psutil.NoSuchProcess:
+                    del self._procs[name]
+                except psutil.AccessDenied:
+                    pass
 
 
 def monitor_resource_usage(
@@ -67,54 +133,22 @@ def monitor_resource_usage(
     sample_interval: float = 0.5,
 ) -> ResourceSummary:
     """Monitor resource usage while tool performs operations."""
-    samples = []
     pid = tool.get_pid()
 
     if pid is None:
-        return ResourceSummary(
-            tool=tool.name,
-            samples=0,
-            peak_memory_mb=0,
-            avg_memory_mb=0,
-            peak_cpu_percent=0,
-            avg_cpu_percent=0,
-            thread_count=0,
-        )
-
-    end_time = time.time() + duration_seconds
-
-    while time.time() < end_time:
-        stats = _get_process_stats(pid)
-        if stats:
-            cpu, memory, threads = stats
-            samples.append(ResourceSample(
-                timestamp=time.time(),
-                cpu_percent=cpu,
-                memory_mb=memory,
-                threads=threads,
-            ))
-        time.sleep(sample_interval)
-
-    if not samples:
-        return ResourceSummary(
-            tool=tool.name,
-            samples=0,
-            peak_memory_mb=0,
-            avg_memory_mb=0,
-            peak_cpu_percent=0,
-            avg_cpu_percent=0,
-            thread_count=0,
-        )
+        return _empty_summary(tool.name)
 
-    return ResourceSummary(
-        tool=tool.name,
-        samples=len(samples),
-        peak_memory_mb=max(s.memory_mb for s in samples),
-        avg_memory_mb=sum(s.memory_mb for s in samples) / len(samples),
-        peak_cpu_percent=max(s.cpu_percent for s in samples),
-        avg_cpu_percent=sum(s.cpu_percent for s in samples) / len(samples),
-        thread_count=samples[-1].threads,
-    )
+    monitor = ResourceMonitor({tool.name: pid}, sample_interval)
+    monitor.start()
+    time.sleep(duration_seconds)
+    return monitor.stop()[tool.name]
+
+
+def _run_workload(tool: BrowserTool) -> None:
+    """Drive the operations measured by the resource benchmark."""
+    tool.navigate("https://example.com")
+    tool.navigate("https://quotes.toscrape.com/")
+    tool.snapshot()
 
 
 def run_resource_benchmark(tools: list[BrowserTool]) -> dict:
@@ -123,37 +157,51 @@ def run_resource_benchmark(tools: list[BrowserTool]) -> dict:
         "summaries": {},
     }
 
-    for tool in tools:
-        print(f"  [{tool.name}] Monitoring resources...")
+    if not tools:
+        return results
 
-        # Start tool if needed
-        tool.start()
-        time.sleep(1)
+    # Start every tool up front so one monitor can watch all of them. Each
+    # tool is its own process, so starting them concurrently is safe.
+    with ThreadPoolExecutor(max_workers=len(tools)) as executor:
+        list(executor.map(lambda tool: tool.start(), tools))
 
-        # Perform some operations while monitoring
+    pids = {}
+    for tool in tools:
         pid = tool.get_pid()
         if pid:
-            # Do some work
-            tool.navigate("https://example.com")
-            summary = monitor_resource_usage(tool, duration_seconds=5)
+            pids[tool.name] = pid
+    time.sleep(1)
+
+    monitored = [tool for tool in tools if tool.name in pids]
+    summaries = {}
+    if monitored:
+        print(f"  Monitoring {len(monitored)} tool(s)...")
+
+        # One window spans the whole workload, so peaks and averages come
+        # from a single continuous sample stream
+        monitor = ResourceMonitor(pids)
+        monitor.start()
+        with ThreadPoolExecutor(max_workers=len(monitored)) as executor:
+            list(executor.map(_run_workload, monitored))
+        time.sleep(MONITOR_WINDOW_SECONDS)
+        summaries = monitor.stop()
 
-            # Do more work
-            tool.navigate("https://quotes.toscrape.com/")
-            tool.snapshot()
-            summary2 = monitor_resource_usage(tool, duration_seconds=5)
+    for tool in tools:
+        print(f"  [{tool.name}]")
 
-            # Combine summaries
+        if tool.name in pids:
+            summary = summaries[tool.name]
             results["summaries"][tool.name] = {
-                "peak_memory_mb": max(summary.peak_memory_mb, summary2.peak_memory_mb),
-                "avg_memory_mb": (summary.avg_memory_mb + summary2.avg_memory_mb) / 2,
-                "peak_cpu_percent": max(summary.peak_cpu_percent, summary2.peak_cpu_percent),
-                "avg_cpu_percent": (summary.avg_cpu_percent + summary2.avg_cpu_percent) / 2,
-                "thread_count": summary2.thread_count,
-                "samples": summary.samples + summary2.samples,
+                "peak_memory_mb": summary.peak_memory_mb,
+                "avg_memory_mb": summary.avg_memory_mb,
+                "peak_cpu_percent": summary.peak_cpu_percent,
+                "avg_cpu_percent": summary.avg_cpu_percent,
+                "thread_count": summary.thread_count,
+                "samples": summary.samples,
             }
 
-            print(f"    Memory: {results['summaries'][tool.name]['peak_memory_mb']:.1f} MB peak")
-            print(f"    CPU: {results['summaries'][tool.name]['avg_cpu_percent']:.1f}% avg")
+            print(f"    Memory: {summary.peak_memory_mb:.1f} MB peak")
+            print(f"    CPU: {summary.avg_cpu_percent:.1f}% avg")
         else:
             print(f"    [SKIP] Cannot get PID for {tool.name}")
             results["summaries"][tool.name] = {
@@ -2,14 +2,19 @@
 
 from __future__ import annotations
 
-import statistics
+import math
+import sys
+import threading
 import time
-from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, fields
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable
 
 from tools.base import BrowserTool, BenchmarkResult
 
+from .raw_log import RawResultStream
+
 
 # Test URLs
 TEST_URLS = {
@@ -20,6 +25,19 @@ TEST_URLS = {
 }
 
 
+# Per-iteration progress is written in batches of this many lines so that
+# terminal I/O doesn't run between every measured call
+LOG_FLUSH_EVERY = 10
+
+# Serializes terminal writes when several tools are benchmarked at once
+_LOG_LOCK = threading.Lock()
+
+
+# raw_results is stored column-wise: one list per BenchmarkResult field,
+# with row i of every column describing the same measurement
+RAW_FIELDS = tuple(f.name for f in fields(BenchmarkResult))
+
+
 @dataclass
 class OperationSummary:
     """Statistical summary of an operation."""
@@ -39,17 +57,37 @@ class OperationSummary:
     warm_mean_ms: float
 
 
-def _percentile(data: list[float], p: float) -> float:
-    """Calculate percentile."""
-    if not data:
+def _percentile(sorted_data: list[float], p: float) -> float:
+    """Calculate percentile of already-sorted data (linear interpolation)."""
+    if not sorted_data:
         return 0.0
-    sorted_data = sorted(data)
-    k = (len(sorted_data) - 1) * p / 100
+    last = len(sorted_data) - 1
+    k = last * p / 100
     f = int(k)
-    c = f + 1 if f < len(sorted_data) - 1 else f
+    c = f + 1 if f < last else f
     return sorted_data[f] + (k - f) * (sorted_data[c] - sorted_data[f])
 
 
+def _log(*lines: str) -> None:
+    """Write lines to stdout as one uninterrupted block."""
+    with _LOG_LOCK:
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
+
+
+def _flush_log(lines: list[str]) -> None:
+    """Write buffered progress lines in a single call and clear the buffer."""
+    if lines:
+        _log(*lines)
+        lines.clear()
+
+
+def _extend_raw(raw: dict[str, list], results: list[BenchmarkResult]) -> None:
+    """Append results to the column-wise raw results."""
+    for name, column in raw.items():
+        column.extend([getattr(r, name) for r in results])
+
+
 def _compute_summary(results: list[BenchmarkResult]) -> OperationSummary:
     """Compute statistical summary from results."""
     if not results:
@@ -70,29 +108,81 @@ def _compute_summary(results: list[BenchmarkResult]) -> OperationSummary:
             warm_mean_ms=0.0,
         )
 
-    successful = [r for r in results if r.success]
-    latencies = [r.latency_ms for r in successful]
-    cold_latencies = [r.latency_ms for r in successful if r.is_cold_start]
-    warm_latencies = [r.latency_ms for r in successful if not r.is_cold_start]
+    # One pass over the results: collect successful latencies for the order
+    # statistics, accumulate mean/variance with Welford's method, keep a
+    # running warm-only sum, and pick the first cold start
+    latencies = []
+    n = 0
+    mean = 0.0
+    m2 = 0.0
+    warm_count = 0
+    warm_total = 0.0
+    cold_start_ms = None
+    for r in results:
+        if not r.success:
+            continue
+        x = r.latency_ms
+        latencies.append(x)
+        n += 1
+        delta = x - mean
+        mean += delta / n
+        m2 += delta * (x - mean)
+        if not r.is_cold_start:
+            warm_count += 1
+            warm_total += x
+        elif cold_start_ms is None:
+            cold_start_ms = x
+
+    # Sort once; every order statistic reads from the same sorted copy
+    # (p50 interpolates exactly like statistics.median)
+    sorted_latencies = sorted(latencies)
 
     return OperationSummary(
         tool=results[0].tool,
         operation=results[0].operation,
         test_case=results[0].test_case,
         count=len(results),
-        success_rate=len(successful) / len(results) if results else 0.0,
-        mean_ms=statistics.mean(latencies) if latencies else 0.0,
-        median_ms=statistics.median(latencies) if latencies else 0.0,
-        std_dev_ms=statistics.stdev(latencies) if len(latencies) > 1 else 0.0,
-        min_ms=min(latencies) if latencies else 0.0,
-        max_ms=max(latencies) if latencies else 0.0,
-        p95_ms=_percentile(latencies, 95),
-        p99_ms=_percentile(latencies, 99),
-        cold_start_ms=cold_latencies[0] if cold_latencies else None,
-        warm_mean_ms=statistics.mean(warm_latencies) if warm_latencies else 0.0,
+        success_rate=n / len(results),
+        mean_ms=mean,
+        median_ms=_percentile(sorted_latencies, 50),
+        std_dev_ms=math.sqrt(m2 / (n - 1)) if n > 1 else 0.0,
+        min_ms=sorted_latencies[0] if sorted_latencies else 0.0,
+        max_ms=sorted_latencies[-1] if sorted_latencies else 0.0,
+        p95_ms=_percentile(sorted_latencies, 95),
+        p99_ms=_percentile(sorted_latencies, 99),
+        cold_start_ms=cold_start_ms,
+        warm_mean_ms=warm_total / warm_count if warm_count else 0.0,
     )
 
 
+def _warm_up(tool: BrowserTool, op: str, warmup: int, call: Callable[[int], BenchmarkResult]) -> None:
+    """Run op's warmup iterations unless the running browser already did them.
+
+    The op only counts as warmed once every iteration has run and
+    succeeded, so a failed or interrupted warmup is redone next time.
+    """
+    if op in tool.warmed_ops:
+        return
+    ok = True
+    for i in range(warmup):
+        ok = call(i).success and ok
+    if ok:
+        tool.warmed_ops.add(op)
+
+
+def _open_page(tool: BrowserTool, url: str, test_case: str) -> bool:
+    """Navigate to url for setup unless the tool is already on that page."""
+    if tool.current_url == url:
+        return True
+    nav_result = tool.navigate(url, test_case=test_case, iteration=0)
+    if not nav_result.success:
+        _log(f"    Navigation failed: {nav_result.error}")
+        tool.current_url = None
+        return False
+    tool.current_url = url
+    return True
+
+
 def benchmark_navigate(
     tool: BrowserTool,
     iterations: int,
@@ -102,18 +192,23 @@ def benchmark_navigate(
     results = []
     url = TEST_URLS["simple"]
 
-    print(f"  [{tool.name}] Navigate ({url})")
+    _log(f"  [{tool.name}] Navigate ({url})")
 
-    # Warmup
-    for i in range(warmup):
-        tool.navigate(url, test_case="warmup", iteration=i)
+    # Warmup (once per running browser)
+    _warm_up(tool, "navigate", warmup, lambda i: tool.navigate(url, test_case="warmup", iteration=i))
 
     # Benchmark
+    log: list[str] = []
     for i in range(iterations):
         result = tool.navigate(url, test_case="navigate_simple", iteration=i)
         results.append(result)
         status = "" if result.success else ""
-        print(f"    [{i+1}/{iterations}] {status} {result.latency_ms:.1f}ms")
+        log.append(f"    [{i+1}/{iterations}] {status} {result.latency_ms:.1f}ms")
+        if len(log) >= LOG_FLUSH_EVERY:
+            _flush_log(log)
+    _flush_log(log)
+
+    tool.current_url = url if results and results[-1].success else None
 
     return results
 
@@ -127,25 +222,26 @@ def benchmark_snapshot(
     results = []
     url = TEST_URLS["quotes"]
 
-    print(f"  [{tool.name}] Snapshot ({url})")
+    _log(f"  [{tool.name}] Snapshot ({url})")
 
-    # Navigate first
-    nav_result = tool.navigate(url, test_case="snapshot_setup", iteration=0)
-    if not nav_result.success:
-        print(f"    Navigation failed: {nav_result.error}")
+    # Navigate first (skipped if the previous operation left us there)
+    if not _open_page(tool, url, "snapshot_setup"):
         return results
 
-    # Warmup
-    for i in range(warmup):
-        tool.snapshot(test_case="warmup", iteration=i)
+    # Warmup (once per running browser)
+    _warm_up(tool, "snapshot", warmup, lambda i: tool.snapshot(test_case="warmup", iteration=i))
 
     # Benchmark
+    log: list[str] = []
     for i in range(iterations):
         result = tool.snapshot(test_case="snapshot_quotes", iteration=i)
         results.append(result)
         status = "" if result.success else ""
         tokens = result.token_estimate or 0
-        print(f"    [{i+1}/{iterations}] {status} {result.latency_ms:.1f}ms (~{tokens} tokens)")
+        log.append(f"    [{i+1}/{iterations}] {status} {result.latency_ms:.1f}ms (~{tokens} tokens)")
+        if len(log) >= LOG_FLUSH_EVERY:
+            _flush_log(log)
+    _flush_log(log)
 
     return results
 
@@ -161,25 +257,33 @@ def benchmark_screenshot(
     output_dir = Path("/tmp/fgp-benchmark-screenshots")
     output_dir.mkdir(parents=True, exist_ok=True)
 
-    print(f"  [{tool.name}] Screenshot ({url})")
+    _log(f"  [{tool.name}] Screenshot ({url})")
 
-    # Navigate first
-    nav_result = tool.navigate(url, test_case="screenshot_setup", iteration=0)
-    if not nav_result.success:
-        print(f"    Navigation failed: {nav_result.error}")
+    # Navigate first (skipped if the previous operation left us there)
+    if not _open_page(tool, url, "screenshot_setup"):
         return results
 
-    # Warmup
-    for i in range(warmup):
-        tool.screenshot(str(output_dir / f"warmup_{i}.png"), test_case="warmup", iteration=i)
+    # Build output paths up front so no path work sits between measured calls.
+    # Warmup files are per tool too, so concurrent tools never share a file.
+    prefix = f"{output_dir}/{tool.name}_"
+    output_paths = [f"{prefix}{i}.png" for i in range(iterations)]
+
+    # Warmup (once per running browser)
+    _warm_up(
+        tool, "screenshot", warmup,
+        lambda i: tool.screenshot(f"{prefix}warmup_{i}.png", test_case="warmup", iteration=i),
+    )
 
     # Benchmark
-    for i in range(iterations):
-        output_path = str(output_dir / f"{tool.name}_{i}.png")
+    log: list[str] = []
+    for i, output_path in enumerate(output_paths):
         result = tool.screenshot(output_path, test_case="screenshot_simple", iteration=i)
         results.append(result)
         status = "" if result.success else ""
-        print(f"    [{i+1}/{iterations}] {status} {result.latency_ms:.1f}ms")
+        log.append(f"    [{i+1}/{iterations}] {status} {result.latency_ms:.1f}ms")
+        if len(log) >= LOG_FLUSH_EVERY:
+            _flush_log(log)
+    _flush_log(log)
 
     return results
 
@@ -193,24 +297,25 @@ def benchmark_click(
     results = []
     url = TEST_URLS["form"]
 
-    print(f"  [{tool.name}] Click ({url})")
+    _log(f"  [{tool.name}] Click ({url})")
 
-    # Navigate first
-    nav_result = tool.navigate(url, test_case="click_setup", iteration=0)
-    if not nav_result.success:
-        print(f"    Navigation failed: {nav_result.error}")
+    # Navigate first (skipped if the previous operation left us there)
+    if not _open_page(tool, url, "click_setup"):
         return results
 
-    # Warmup
-    for i in range(warmup):
-        tool.click("input#username", test_case="warmup", iteration=i)
+    # Warmup (once per running browser)
+    _warm_up(tool, "click", warmup, lambda i: tool.click("input#username", test_case="warmup", iteration=i))
 
     # Benchmark
+    log: list[str] = []
     for i in range(iterations):
         result = tool.click("input#username", test_case="click_input", iteration=i)
         results.append(result)
         status = "" if result.success else ""
-        print(f"    [{i+1}/{iterations}] {status} {result.latency_ms:.1f}ms")
+        log.append(f"    [{i+1}/{iterations}] {status} {result.latency_ms:.1f}ms")
+        if len(log) >= LOG_FLUSH_EVERY:
+            _flush_log(log)
+    _flush_log(log)
 
     return results
 
@@ -224,70 +329,102 @@ def benchmark_fill(
     results = []
     url = TEST_URLS["form"]
 
-    print(f"  [{tool.name}] Fill ({url})")
+    _log(f"  [{tool.name}] Fill ({url})")
 
-    # Navigate first
-    nav_result = tool.navigate(url, test_case="fill_setup", iteration=0)
-    if not nav_result.success:
-        print(f"    Navigation failed: {nav_result.error}")
+    # Navigate first (skipped if the previous operation left us there)
+    if not _open_page(tool, url, "fill_setup"):
         return results
 
-    # Warmup
-    for i in range(warmup):
-        tool.fill("input#username", "testuser", test_case="warmup", iteration=i)
+    # Warmup (once per running browser)
+    _warm_up(tool, "fill", warmup, lambda i: tool.fill("input#username", "testuser", test_case="warmup", iteration=i))
 
     # Benchmark
+    log: list[str] = []
     for i in range(iterations):
         result = tool.fill("input#username", f"testuser{i}", test_case="fill_input", iteration=i)
         results.append(result)
         status = "" if result.success else ""
-        print(f"    [{i+1}/{iterations}] {status} {result.latency_ms:.1f}ms")
+        log.append(f"    [{i+1}/{iterations}] {status} {result.latency_ms:.1f}ms")
+        if len(log) >= LOG_FLUSH_EVERY:
+            _flush_log(log)
+    _flush_log(log)
 
     return results
 
 
+# Operations in the order each tool runs them
+OPERATION_BENCHMARKS = (
+    ("navigate", benchmark_navigate),
+    ("snapshot", benchmark_snapshot),
+    ("screenshot", benchmark_screenshot),
+    ("click", benchmark_click),
+    ("fill", benchmark_fill),
+)
+
+
+def _benchmark_tool(
+    tool: BrowserTool,
+    iterations: int,
+    warmup: int,
+    raw_stream: RawResultStream | None = None,
+) -> list[tuple[str, list[BenchmarkResult]]]:
+    """Run every single-operation benchmark on one tool, in order."""
+    _log(f"\n[{tool.name}]", "-" * 40)
+    # Other suites may have moved the browser since; only trust page state
+    # recorded during this sequence
+    tool.current_url = None
+    op_results = []
+    for op, bench in OPERATION_BENCHMARKS:
+        results = bench(tool, iterations, warmup)
+        if raw_stream is not None:
+            raw_stream.write([{name: getattr(r, name) for name in RAW_FIELDS} for r in results])
+        op_results.append((op, results))
+    return op_results
+
+
 def run_single_ops_benchmark(
     tools: list[BrowserTool],
     config: Any,
 ) -> dict:
-    """Run all single operation benchmarks."""
+    """Run all single operation benchmarks.
+
+    With ``config.parallel_tools > 1`` the tools are benchmarked concurrently
+    (operations stay sequential within a tool). This shortens wall time but
+    lets the tools compete for CPU, so measured runs should keep the default.
+    """
     results = {
-        "operations": ["navigate", "snapshot", "screenshot", "click", "fill"],
-        "raw_results": [],
+        "operations": [op for op, _ in OPERATION_BENCHMARKS],
+        "raw_results": {name: [] for name in RAW_FIELDS},
         "summaries": {},
     }
 
     iterations = config.min_iterations
     warmup = config.warmup_iterations
 
-    for tool in tools:
-        print(f"\n[{tool.name}]")
-        print("-" * 40)
-
-        # Navigation
-        nav_results = benchmark_navigate(tool, iterations, warmup)
-        results["raw_results"].extend([r.__dict__ for r in nav_results])
-        results["summaries"][f"{tool.name}_navigate"] = _compute_summary(nav_results).__dict__
-
-        # Snapshot
-        snap_results = benchmark_snapshot(tool, iterations, warmup)
-        results["raw_results"].extend([r.__dict__ for r in snap_results])
-        results["summaries"][f"{tool.name}_snapshot"] = _compute_summary(snap_results).__dict__
-
-        # Screenshot
-        ss_results = benchmark_screenshot(tool, iterations, warmup)
-        results["raw_results"].extend([r.__dict__ for r in ss_results])
-        results["summaries"][f"{tool.name}_screenshot"] = _compute_summary(ss_results).__dict__
-
-        # Click
-        click_results = benchmark_click(tool, iterations, warmup)
-        results["raw_results"].extend([r.__dict__ for r in click_results])
-        results["summaries"][f"{tool.name}_click"] = _compute_summary(click_results).__dict__
-
-        # Fill
-        fill_results = benchmark_fill(tool, iterations, warmup)
-        results["raw_results"].extend([r.__dict__ for r in fill_results])
-        results["summaries"][f"{tool.name}_fill"] = _compute_summary(fill_results).__dict__
+    # Raw results are still collected in memory for the statistics; the
+    # stream is an optional live copy
+    raw_stream = None
+    if config.raw_log:
+        raw_stream = RawResultStream(config.raw_log)
+        results["raw_results_path"] = config.raw_log
+
+    try:
+        if config.parallel_tools > 1 and len(tools) > 1:
+            with ThreadPoolExecutor(max_workers=config.parallel_tools) as executor:
+                per_tool = list(executor.map(
+                    lambda tool: _benchmark_tool(tool, iterations, warmup, raw_stream), tools
+                ))
+        else:
+            per_tool = [_benchmark_tool(tool, iterations, warmup, raw_stream) for tool in tools]
+    finally:
+        if raw_stream is not None:
+            raw_stream.close()
+
+    # Merge in tool order so raw results don't depend on scheduling
+    for tool, op_results in zip(tools, per_tool):
+        for op, op_result in op_results:
+            _extend_raw(results["raw_results"], op_result)
+            results["summaries"][f"{tool.name}_{op}"] = _compute_summary(op_result).__dict__
 
     # Create comparison table
     comparison = {}
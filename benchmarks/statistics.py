@@ -4,8 +4,15 @@ from __future__ import annotations
 
 import math
 import statistics
+from collections import defaultdict
+from itertools import combinations
 from typing import Any
 
+_INV_SQRT2 = 1.0 / math.sqrt(2.0)
+
+# Z-score for confidence level (approximate)
+_Z_SCORES = {0.90: 1.645, 0.95: 1.96, 0.99: 2.576}
+
 
 def mann_whitney_u(sample1: list[float], sample2: list[float]) -> tuple[float, float]:
     """
@@ -21,25 +28,26 @@ def mann_whitney_u(sample1: list[float], sample2: list[float]) -> tuple[float, f
     n1 = len(sample1)
     n2 = len(sample2)
 
-    # Combine and rank
-    combined = [(v, 1, i) for i, v in enumerate(sample1)] + [(v, 2, i) for i, v in enumerate(sample2)]
-    combined.sort(key=lambda x: x[0])
+    # Rank the pooled samples through an argsort of indices rather than
+    # sorting (value, group, index) tuples; sample1 occupies indices < n1
+    values = sample1 + sample2
+    n = n1 + n2
+    order = sorted(range(n), key=values.__getitem__)
 
-    # Assign ranks (handle ties by averaging)
-    ranks = []
+    # Walk runs of tied values (averaging their ranks) and add each run's
+    # rank once per sample-1 member, so no per-element rank list is needed
+    rank1_sum = 0.0
     i = 0
-    while i < len(combined):
-        j = i
-        while j < len(combined) and combined[j][0] == combined[i][0]:
+    while i < n:
+        v = values[order[i]]
+        j = i + 1
+        while j < n and values[order[j]] == v:
             j += 1
-        avg_rank = (i + 1 + j) / 2
-        for k in range(i, j):
-            ranks.append(avg_rank)
+        in_sample1 = sum(1 for k in range(i, j) if order[k] < n1)
+        if in_sample1:
+            rank1_sum += in_sample1 * (i + 1 + j) / 2
         i = j
 
-    # Sum ranks for sample 1
-    rank1_sum = sum(ranks[i] for i, (_, group, _) in enumerate(combined) if group == 1)
-
     # Calculate U
     u1 = rank1_sum - n1 * (n1 + 1) / 2
     u2 = n1 * n2 - u1
@@ -56,17 +64,13 @@ def mann_whitney_u(sample1: list[float], sample2: list[float]) -> tuple[float, f
 
     z = (u - mean_u) / std_u
 
-    # Two-tailed p-value approximation
-    p_value = 2 * (1 - _normal_cdf(abs(z)))
+    # Two-tailed p-value approximation. 2 * (1 - Phi(|z|)) == erfc(|z| / sqrt(2)),
+    # and erfc keeps its precision in the tail where 1 - Phi(|z|) rounds to 0
+    p_value = math.erfc(abs(z) * _INV_SQRT2)
 
     return u, p_value
 
 
-def _normal_cdf(x: float) -> float:
-    """Approximate standard normal CDF."""
-    return 0.5 * (1 + math.erf(x / math.sqrt(2)))
-
-
 def cohens_d(sample1: list[float], sample2: list[float]) -> float:
     """
     Cohen's d effect size.
@@ -102,22 +106,30 @@ def cohens_d(sample1: list[float], sample2: list[float]) -> float:
 def compute_confidence_interval(
     data: list[float],
     confidence: float = 0.95,
+    *,
+    mean: float | None = None,
+    std: float | None = None,
 ) -> tuple[float, float]:
-    """Compute confidence interval for mean."""
+    """Compute confidence interval for mean.
+
+    Callers that already have the sample mean and standard deviation can
+    pass them in to skip recomputing them from ``data``.
+    """
     if not data:
         return 0.0, 0.0
 
     n = len(data)
-    mean = statistics.mean(data)
+    if mean is None:
+        mean = statistics.fmean(data)
 
     if n < 2:
         return mean, mean
 
-    std_err = statistics.stdev(data) / math.sqrt(n)
+    if std is None:
+        std = statistics.stdev(data, mean)
+    std_err = std / math.sqrt(n)
 
-    # Z-score for confidence level (approximate)
-    z_scores = {0.90: 1.645, 0.95: 1.96, 0.99: 2.576}
-    z = z_scores.get(confidence, 1.96)
+    z = _Z_SCORES.get(confidence, 1.96)
 
     margin = z * std_err
     return mean - margin, mean + margin
@@ -128,13 +140,35 @@ def remove_outliers(data: list[float], sigma: float = 3.0) -> list[float]:
     if len(data) < 3:
         return data
 
-    mean = statistics.mean(data)
-    std = statistics.stdev(data)
+    mean = statistics.fmean(data)
+    std = statistics.stdev(data, mean)
 
     if std == 0:
         return data
 
-    return [x for x in data if abs(x - mean) <= sigma * std]
+    lo = mean - sigma * std
+    hi = mean + sigma * std
+
+    # Usually nothing is out of range; avoid building a copy in that case
+    if lo <= min(data) and max(data) <= hi:
+        return data
+
+    return [x for x in data if lo <= x <= hi]
+
+
+def _mean_std(data: list[float]) -> tuple[float, float]:
+    """Sample mean and standard deviation (0.0 where undefined)."""
+    if not data:
+        return 0.0, 0.0
+    mean = statistics.fmean(data)
+    std = statistics.stdev(data, mean) if len(data) > 1 else 0.0
+    return mean, std
+
+
+def _mean_and_ci(data: list[float]) -> tuple[float, tuple[float, float]]:
+    """Sample mean and confidence interval, sharing one stdev computation."""
+    mean, std = _mean_std(data)
+    return mean, compute_confidence_interval(data, mean=mean, std=std)
 
 
 def run_significance_tests(
@@ -142,13 +176,24 @@ def run_significance_tests(
     results_b: list[float],
     tool_a: str,
     tool_b: str,
+    *,
+    mean_a: float | None = None,
+    mean_b: float | None = None,
+    ci_a: tuple[float, float] | None = None,
+    ci_b: tuple[float, float] | None = None,
 ) -> dict:
-    """Run statistical significance tests between two tools."""
+    """Run statistical significance tests between two tools.
+
+    Per-sample means and confidence intervals may be passed in when the
+    caller compares the same sample against several others.
+    """
     u, p_value = mann_whitney_u(results_a, results_b)
     d = cohens_d(results_a, results_b)
 
-    ci_a = compute_confidence_interval(results_a)
-    ci_b = compute_confidence_interval(results_b)
+    if mean_a is None or ci_a is None:
+        mean_a, ci_a = _mean_and_ci(results_a)
+    if mean_b is None or ci_b is None:
+        mean_b, ci_b = _mean_and_ci(results_b)
 
     return {
         "comparison": f"{tool_a} vs {tool_b}",
@@ -157,8 +202,8 @@ def run_significance_tests(
         "significant": p_value < 0.05,
         "cohens_d": round(d, 3),
         "effect_size": _interpret_effect_size(d),
-        f"{tool_a}_mean": round(statistics.mean(results_a), 1) if results_a else 0,
-        f"{tool_b}_mean": round(statistics.mean(results_b), 1) if results_b else 0,
+        f"{tool_a}_mean": round(mean_a, 1) if results_a else 0,
+        f"{tool_b}_mean": round(mean_b, 1) if results_b else 0,
         f"{tool_a}_ci_95": [round(ci_a[0], 1), round(ci_a[1], 1)],
         f"{tool_b}_ci_95": [round(ci_b[0], 1), round(ci_b[1], 1)],
     }
@@ -196,33 +241,50 @@ def compute_statistics(report: Any, config: Any) -> dict:
     if report.single_ops and "raw_results" in report.single_ops:
         raw = report.single_ops["raw_results"]
 
-        # Group by tool and operation
-        by_tool_op: dict[str, list[float]] = {}
-        for r in raw:
-            if r.get("success"):
-                key = f"{r['tool']}_{r['operation']}"
-                if key not in by_tool_op:
-                    by_tool_op[key] = []
-                by_tool_op[key].append(r["latency_ms"])
-
-        # Find all tools and operations
-        tools = list(set(r["tool"] for r in raw))
-        operations = list(set(r["operation"] for r in raw))
+        # Group by tool and operation (raw results are stored column-wise),
+        # collecting the tool and operation names in the same pass
+        by_tool_op: defaultdict[tuple[str, str], list[float]] = defaultdict(list)
+        tool_names: set[str] = set()
+        op_names: set[str] = set()
+        for tool, op, latency, success in zip(
+            raw["tool"], raw["operation"], raw["latency_ms"], raw["success"]
+        ):
+            tool_names.add(tool)
+            op_names.add(op)
+            if success:
+                by_tool_op[(tool, op)].append(latency)
+
+        # Sorted so comparison order (and naming) is deterministic
+        tools = sorted(tool_names)
+        operations = sorted(op_names)
+
+        # Sort every sample once. The pooled input mann_whitney_u ranks is
+        # then two ascending runs, which Timsort merges in linear time, so
+        # no pair pays for a full re-sort
+        for data in by_tool_op.values():
+            data.sort()
+
+        # Per operation, the tools that have data along with the sample's
+        # mean and CI; each sample meets every other tool, so these are
+        # computed once here rather than once per pair
+        per_op: dict[str, list[tuple]] = {
+            op: [
+                (tool, by_tool_op[(tool, op)], *_mean_and_ci(by_tool_op[(tool, op)]))
+                for tool in tools
+                if by_tool_op.get((tool, op))
+            ]
+            for op in operations
+        }
 
         # Run pairwise comparisons
-        for op in operations:
-            for i, tool_a in enumerate(tools):
-                for tool_b in tools[i+1:]:
-                    key_a = f"{tool_a}_{op}"
-                    key_b = f"{tool_b}_{op}"
-
-                    if key_a in by_tool_op and key_b in by_tool_op:
-                        data_a = by_tool_op[key_a]
-                        data_b = by_tool_op[key_b]
-
-                        comparison_key = f"{op}_{tool_a}_vs_{tool_b}"
-                        stats["comparisons"][comparison_key] = run_significance_tests(
-                            data_a, data_b, tool_a, tool_b
-                        )
+        for op, samples in per_op.items():
+            for sample_a, sample_b in combinations(samples, 2):
+                tool_a, data_a, mean_a, ci_a = sample_a
+                tool_b, data_b, mean_b, ci_b = sample_b
+                comparison_key = f"{op}_{tool_a}_vs_{tool_b}"
+                stats["comparisons"][comparison_key] = run_significance_tests(
+                    data_a, data_b, tool_a, tool_b,
+                    mean_a=mean_a, mean_b=mean_b, ci_a=ci_a, ci_b=ci_b,
+                )
 
     return stats
@@ -2,37 +2,155 @@
 
 from __future__ import annotations
 
-import statistics
+import sys
+import threading
 import time
+from array import array
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Any, Callable
 
-from tools.base import BrowserTool, BenchmarkResult
+from tools.base import BrowserTool, BenchmarkResult, ms_since, ns_since
 
+from .raw_log import RawResultStream
 
-@dataclass
-class StepResult:
-    """Result of a single workflow step."""
-    step_name: str
-    latency_ms: float
-    success: bool
-    error: str | None = None
+
+# Estimated per-step cost of driving the browser through Playwright MCP,
+# used to project MCP workflow latency from a workflow's step count
+MCP_OVERHEAD_MS = 2300
 
 
 @dataclass
 class WorkflowResult:
-    """Result of a complete workflow."""
+    """Result of a complete workflow.
+
+    Steps are stored column-wise: one entry per step in each of the
+    parallel containers, appended through ``add_step``.
+    """
     workflow_name: str
     tool: str
     iteration: int
-    steps: list[StepResult] = field(default_factory=list)
+    step_names: list[str] = field(default_factory=list)
+    latencies_ns: array = field(default_factory=lambda: array("q"))  # Integer nanoseconds, converted at emit
+    successes: bytearray = field(default_factory=bytearray)
+    errors: list[str | None] = field(default_factory=list)
     total_latency_ms: float = 0.0
     success: bool = True
     error: str | None = None
 
     @property
     def step_count(self) -> int:
-        return len(self.steps)
+        return len(self.step_names)
+
+    def add_step(self, name: str, latency_ns: int, success: bool, error: str | None = None) -> None:
+        """Record one step, folding its outcome into the workflow's success."""
+        self.step_names.append(name)
+        self.latencies_ns.append(latency_ns)
+        self.successes.append(bool(success))
+        self.success = self.success and bool(success)
+        self.errors.append(error)
+
+
+@dataclass(frozen=True)
+class _Step:
+    """One workflow step: a tool method call and how to treat its outcome."""
+    label: str
+    method: str
+    args: tuple = ()
+    templated: bool = False  # args are str.format templates over {tool} and {iteration}
+    fallback_url: str | None = None  # Navigate here instead if the call fails
+    required: bool = False  # Abort the workflow if this step fails
+    settle_s: float = 0.0  # Pause afterwards for the page to load
+
+    def call_args(self, tool_name: str, iteration: int) -> tuple:
+        if not self.templated:
+            return self.args
+        return tuple(a.format(tool=tool_name, iteration=iteration) for a in self.args)
+
+
+_LOGIN_STEPS = (
+    _Step("navigate", "navigate", ("https://the-internet.herokuapp.com/login",), required=True),
+    _Step("fill_username", "fill", ("input#username", "tomsmith"), required=True),
+    _Step("fill_password", "fill", ("input#password", "SuperSecretPassword!"), required=True),
+    _Step("click_submit", "click", ("button[type='submit']",), required=True, settle_s=0.5),
+    _Step("verify_snapshot", "snapshot"),
+)
+
+_SEARCH_EXTRACT_STEPS = (
+    _Step("navigate", "navigate", ("https://quotes.toscrape.com/",), required=True),
+    _Step("snapshot_initial", "snapshot"),
+    _Step(
+        "click_author", "click", ("small.author + a",),
+        fallback_url="https://quotes.toscrape.com/author/Albert-Einstein/",
+        settle_s=0.3,
+    ),
+    _Step("snapshot_author", "snapshot"),
+    _Step("navigate_back", "navigate", ("https://quotes.toscrape.com/",)),
+    _Step("snapshot_final", "snapshot"),
+)
+
+_FORM_SUBMIT_STEPS = (
+    _Step("navigate", "navigate", ("https://httpbin.org/forms/post",), required=True),
+    _Step("fill_name", "fill", ("input[name='custname']", "Test User")),
+    _Step("fill_phone", "fill", ("input[name='custtel']", "555-1234")),
+    _Step("fill_email", "fill", ("input[name='custemail']", "test@example.com")),
+    _Step("check_topping", "check", ("input[name='topping'][value='cheese']",)),
+    _Step("fill_comments", "fill", ("textarea[name='comments']", "This is a test order")),
+    _Step("screenshot", "screenshot", ("/tmp/form_{tool}_{iteration}.png",), templated=True),
+)
+
+
+@lru_cache(maxsize=None)
+def _pagination_steps(pages: int) -> tuple:
+    """Step table for paging through ``pages`` pages of quotes."""
+    steps = [
+        _Step("navigate", "navigate", ("https://quotes.toscrape.com/",), required=True),
+        _Step("snapshot_page1", "snapshot"),
+    ]
+    for page_num in range(2, pages + 1):
+        steps.append(_Step(
+            f"click_next_{page_num}", "click", ("li.next a",),
+            fallback_url=f"https://quotes.toscrape.com/page/{page_num}/",
+            settle_s=0.2,
+        ))
+        steps.append(_Step(f"snapshot_page{page_num}", "snapshot"))
+    return tuple(steps)
+
+
+def _run_steps(
+    tool: BrowserTool,
+    iteration: int,
+    workflow_name: str,
+    test_case: str,
+    steps: tuple,
+) -> WorkflowResult:
+    """Run a workflow's step table on a tool, timing every step."""
+    result = WorkflowResult(workflow_name=workflow_name, tool=tool.name, iteration=iteration)
+    start = time.perf_counter_ns()
+
+    for step in steps:
+        step_start = time.perf_counter_ns()
+        method = getattr(tool, step.method)
+        r = method(*step.call_args(tool.name, iteration), test_case=test_case, iteration=iteration)
+        if not r.success and step.fallback_url:
+            r = tool.navigate(step.fallback_url, test_case=test_case, iteration=iteration)
+        result.add_step(step.label, ns_since(step_start), r.success, r.error)
+        if not r.success and step.required:
+            return _abort(result, start, r.error)
+
+        if step.settle_s:
+            time.sleep(step.settle_s)
+
+    result.total_latency_ms = ms_since(start)
+    return result
+
+
+def _abort(result: WorkflowResult, start: int, error: str | None) -> WorkflowResult:
+    """Stop a workflow at its most recent (failed) step."""
+    result.error = f"Step {result.step_count} failed: {error}"
+    result.total_latency_ms = ms_since(start)
+    return result
 
 
 def workflow_login(tool: BrowserTool, iteration: int) -> WorkflowResult:
@@ -44,65 +162,7 @@ def workflow_login(tool: BrowserTool, iteration: int) -> WorkflowResult:
     4. Click submit
     5. Verify logged in (snapshot)
     """
-    result = WorkflowResult(workflow_name="login", tool=tool.name, iteration=iteration)
-    start = time.perf_counter()
-
-    # Step 1: Navigate
-    step_start = time.perf_counter()
-    r = tool.navigate("https://the-internet.herokuapp.com/login", test_case="login", iteration=iteration)
-    step = StepResult("navigate", (time.perf_counter() - step_start) * 1000, r.success, r.error)
-    result.steps.append(step)
-    if not r.success:
-        result.success = False
-        result.error = f"Step 1 failed: {r.error}"
-        result.total_latency_ms = (time.perf_counter() - start) * 1000
-        return result
-
-    # Step 2: Fill username
-    step_start = time.perf_counter()
-    r = tool.fill("input#username", "tomsmith", test_case="login", iteration=iteration)
-    step = StepResult("fill_username", (time.perf_counter() - step_start) * 1000, r.success, r.error)
-    result.steps.append(step)
-    if not r.success:
-        result.success = False
-        result.error = f"Step 2 failed: {r.error}"
-        result.total_latency_ms = (time.perf_counter() - start) * 1000
-        return result
-
-    # Step 3: Fill password
-    step_start = time.perf_counter()
-    r = tool.fill("input#password", "SuperSecretPassword!", test_case="login", iteration=iteration)
-    step = StepResult("fill_password", (time.perf_counter() - step_start) * 1000, r.success, r.error)
-    result.steps.append(step)
-    if not r.success:
-        result.success = False
-        result.error = f"Step 3 failed: {r.error}"
-        result.total_latency_ms = (time.perf_counter() - start) * 1000
-        return result
-
-    # Step 4: Click submit
-    step_start = time.perf_counter()
-    r = tool.click("button[type='submit']", test_case="login", iteration=iteration)
-    step = StepResult("click_submit", (time.perf_counter() - step_start) * 1000, r.success, r.error)
-    result.steps.append(step)
-    if not r.success:
-        result.success = False
-        result.error = f"Step 4 failed: {r.error}"
-        result.total_latency_ms = (time.perf_counter() - start) * 1000
-        return result
-
-    # Wait for page load
-    time.sleep(0.5)
-
-    # Step 5: Verify login (snapshot)
-    step_start = time.perf_counter()
-    r = tool.snapshot(test_case="login", iteration=iteration)
-    step = StepResult("verify_snapshot", (time.perf_counter() - step_start) * 1000, r.success, r.error)
-    result.steps.append(step)
-
-    result.total_latency_ms = (time.perf_counter() - start) * 1000
-    result.success = all(s.success for s in result.steps)
-    return result
+    return _run_steps(tool, iteration, "login", "login", _LOGIN_STEPS)
 
 
 def workflow_search_extract(tool: BrowserTool, iteration: int) -> WorkflowResult:
@@ -115,57 +175,7 @@ def workflow_search_extract(tool: BrowserTool, iteration: int) -> WorkflowResult
     5. Navigate back
     6. Get final snapshot
     """
-    result = WorkflowResult(workflow_name="search_extract", tool=tool.name, iteration=iteration)
-    start = time.perf_counter()
-
-    # Step 1: Navigate
-    step_start = time.perf_counter()
-    r = tool.navigate("https://quotes.toscrape.com/", test_case="search", iteration=iteration)
-    step = StepResult("navigate", (time.perf_counter() - step_start) * 1000, r.success, r.error)
-    result.steps.append(step)
-    if not r.success:
-        result.success = False
-        result.total_latency_ms = (time.perf_counter() - start) * 1000
-        return result
-
-    # Step 2: Initial snapshot
-    step_start = time.perf_counter()
-    r = tool.snapshot(test_case="search", iteration=iteration)
-    step = StepResult("snapshot_initial", (time.perf_counter() - step_start) * 1000, r.success, r.error)
-    result.steps.append(step)
-
-    # Step 3: Click author link
-    step_start = time.perf_counter()
-    r = tool.click("small.author + a", test_case="search", iteration=iteration)
-    if not r.success:
-        # Fallback: direct navigation
-        r = tool.navigate("https://quotes.toscrape.com/author/Albert-Einstein/", test_case="search", iteration=iteration)
-    step = StepResult("click_author", (time.perf_counter() - step_start) * 1000, r.success, r.error)
-    result.steps.append(step)
-
-    time.sleep(0.3)
-
-    # Step 4: Author page snapshot
-    step_start = time.perf_counter()
-    r = tool.snapshot(test_case="search", iteration=iteration)
-    step = StepResult("snapshot_author", (time.perf_counter() - step_start) * 1000, r.success, r.error)
-    result.steps.append(step)
-
-    # Step 5: Navigate back
-    step_start = time.perf_counter()
-    r = tool.navigate("https://quotes.toscrape.com/", test_case="search", iteration=iteration)
-    step = StepResult("navigate_back", (time.perf_counter() - step_start) * 1000, r.success, r.error)
-    result.steps.append(step)
-
-    # Step 6: Final snapshot
-    step_start = time.perf_counter()
-    r = tool.snapshot(test_case="search", iteration=iteration)
-    step = StepResult("snapshot_final", (time.perf_counter() - step_start) * 1000, r.success, r.error)
-    result.steps.append(step)
-
-    result.total_latency_ms = (time.perf_counter() - start) * 1000
-    result.success = all(s.success for s in result.steps)
-    return result
+    return _run_steps(tool, iteration, "search_extract", "search", _SEARCH_EXTRACT_STEPS)
 
 
 def workflow_form_submit(tool: BrowserTool, iteration: int) -> WorkflowResult:
@@ -179,58 +189,7 @@ def workflow_form_submit(tool: BrowserTool, iteration: int) -> WorkflowResult:
     6. Fill comments
     7. Take screenshot (verify)
     """
-    result = WorkflowResult(workflow_name="form_submit", tool=tool.name, iteration=iteration)
-    start = time.perf_counter()
-
-    # Step 1: Navigate
-    step_start = time.perf_counter()
-    r = tool.navigate("https://httpbin.org/forms/post", test_case="form", iteration=iteration)
-    step = StepResult("navigate", (time.perf_counter() - step_start) * 1000, r.success, r.error)
-    result.steps.append(step)
-    if not r.success:
-        result.success = False
-        result.total_latency_ms = (time.perf_counter() - start) * 1000
-        return result
-
-    # Step 2: Fill name
-    step_start = time.perf_counter()
-    r = tool.fill("input[name='custname']", "Test User", test_case="form", iteration=iteration)
-    step = StepResult("fill_name", (time.perf_counter() - step_start) * 1000, r.success, r.error)
-    result.steps.append(step)
-
-    # Step 3: Fill phone
-    step_start = time.perf_counter()
-    r = tool.fill("input[name='custtel']", "555-1234", test_case="form", iteration=iteration)
-    step = StepResult("fill_phone", (time.perf_counter() - step_start) * 1000, r.success, r.error)
-    result.steps.append(step)
-
-    # Step 4: Fill email
-    step_start = time.perf_counter()
-    r = tool.fill("input[name='custemail']", "test@example.com", test_case="form", iteration=iteration)
-    step = StepResult("fill_email", (time.perf_counter() - step_start) * 1000, r.success, r.error)
-    result.steps.append(step)
-
-    # Step 5: Check checkbox
-    step_start = time.perf_counter()
-    r = tool.check("input[name='topping'][value='cheese']", test_case="form", iteration=iteration)
-    step = StepResult("check_topping", (time.perf_counter() - step_start) * 1000, r.success, r.error)
-    result.steps.append(step)
-
-    # Step 6: Fill comments
-    step_start = time.perf_counter()
-    r = tool.fill("textarea[name='comments']", "This is a test order", test_case="form", iteration=iteration)
-    step = StepResult("fill_comments", (time.perf_counter() - step_start) * 1000, r.success, r.error)
-    result.steps.append(step)
-
-    # Step 7: Screenshot
-    step_start = time.perf_counter()
-    r = tool.screenshot(f"/tmp/form_{tool.name}_{iteration}.png", test_case="form", iteration=iteration)
-    step = StepResult("screenshot", (time.perf_counter() - step_start) * 1000, r.success, r.error)
-    result.steps.append(step)
-
-    result.total_latency_ms = (time.perf_counter() - start) * 1000
-    result.success = all(s.success for s in result.steps)
-    return result
+    return _run_steps(tool, iteration, "form_submit", "form", _FORM_SUBMIT_STEPS)
 
 
 def workflow_pagination(tool: BrowserTool, iteration: int, pages: int = 5) -> WorkflowResult:
@@ -242,47 +201,7 @@ def workflow_pagination(tool: BrowserTool, iteration: int, pages: int = 5) -> Wo
       - Click next
       - Snapshot page N
     """
-    result = WorkflowResult(workflow_name="pagination", tool=tool.name, iteration=iteration)
-    start = time.perf_counter()
-
-    # Step 1: Navigate
-    step_start = time.perf_counter()
-    r = tool.navigate("https://quotes.toscrape.com/", test_case="pagination", iteration=iteration)
-    step = StepResult("navigate", (time.perf_counter() - step_start) * 1000, r.success, r.error)
-    result.steps.append(step)
-    if not r.success:
-        result.success = False
-        result.total_latency_ms = (time.perf_counter() - start) * 1000
-        return result
-
-    # Step 2: Snapshot page 1
-    step_start = time.perf_counter()
-    r = tool.snapshot(test_case="pagination", iteration=iteration)
-    step = StepResult("snapshot_page1", (time.perf_counter() - step_start) * 1000, r.success, r.error)
-    result.steps.append(step)
-
-    # Loop through pages
-    for page_num in range(2, pages + 1):
-        # Click next
-        step_start = time.perf_counter()
-        r = tool.click("li.next a", test_case="pagination", iteration=iteration)
-        if not r.success:
-            # Fallback: direct navigation
-            r = tool.navigate(f"https://quotes.toscrape.com/page/{page_num}/", test_case="pagination", iteration=iteration)
-        step = StepResult(f"click_next_{page_num}", (time.perf_counter() - step_start) * 1000, r.success, r.error)
-        result.steps.append(step)
-
-        time.sleep(0.2)
-
-        # Snapshot
-        step_start = time.perf_counter()
-        r = tool.snapshot(test_case="pagination", iteration=iteration)
-        step = StepResult(f"snapshot_page{page_num}", (time.perf_counter() - step_start) * 1000, r.success, r.error)
-        result.steps.append(step)
-
-    result.total_latency_ms = (time.perf_counter() - start) * 1000
-    result.success = all(s.success for s in result.steps)
-    return result
+    return _run_steps(tool, iteration, "pagination", "pagination", _pagination_steps(pages))
 
 
 WORKFLOWS: dict[str, Callable[[BrowserTool, int], WorkflowResult]] = {
@@ -293,11 +212,110 @@ WORKFLOWS: dict[str, Callable[[BrowserTool, int], WorkflowResult]] = {
 }
 
 
+# Serializes terminal writes when several tools run a workflow at once
+_LOG_LOCK = threading.Lock()
+
+
+def _log(*lines: str) -> None:
+    """Write lines to stdout as one uninterrupted block."""
+    with _LOG_LOCK:
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
+
+
+def _raw_row(wr: WorkflowResult) -> dict:
+    """Flatten a workflow result into its raw-results row."""
+    return {
+        "workflow": wr.workflow_name,
+        "tool": wr.tool,
+        "iteration": wr.iteration,
+        "steps": {
+            "step_names": wr.step_names,
+            "latencies_ms": [ns / 1_000_000 for ns in wr.latencies_ns],
+            "successes": [bool(ok) for ok in wr.successes],
+            "errors": wr.errors,
+        },
+        "total_ms": wr.total_latency_ms,
+        "step_count": wr.step_count,
+        "success": wr.success,
+        "error": wr.error,
+    }
+
+
+def _moments(xs: list[float]) -> tuple[float, float]:
+    """Mean and sample standard deviation in one pass (Welford's method)."""
+    n = 0
+    mean = 0.0
+    m2 = 0.0
+    for x in xs:
+        n += 1
+        delta = x - mean
+        mean += delta / n
+        m2 += delta * (x - mean)
+    return mean, (m2 / (n - 1)) ** 0.5 if n > 1 else 0.0
+
+
+def _median(sorted_xs: list[float]) -> float:
+    """Median of an already sorted, non-empty list."""
+    mid = len(sorted_xs) // 2
+    if len(sorted_xs) % 2:
+        return sorted_xs[mid]
+    return (sorted_xs[mid - 1] + sorted_xs[mid]) / 2
+
+
+def _run_iterations(
+    tool: BrowserTool,
+    workflow_fn: Callable[[BrowserTool, int], WorkflowResult],
+    iterations: int,
+    live: bool = True,
+    raw_stream: RawResultStream | None = None,
+) -> list[WorkflowResult]:
+    """Run one workflow repeatedly on a tool.
+
+    Progress is printed per iteration when ``live``; otherwise the tool's
+    lines are held back and written as one block so concurrent tools don't
+    interleave.
+    """
+    # Start every workflow from a blank page on the same browser session;
+    # the tool is never relaunched between iterations or workflows
+    tool.reset()
+
+    lines = [f"  [{tool.name}]"]
+    if live:
+        _log(*lines)
+        lines.clear()
+
+    workflow_results = []
+    for i in range(iterations):
+        wr = workflow_fn(tool, i)
+        workflow_results.append(wr)
+        if raw_stream is not None:
+            raw_stream.write([_raw_row(wr)])
+        status = "" if wr.success else ""
+        line = f"    [{i+1}/{iterations}] {status} {wr.total_latency_ms:.0f}ms ({wr.step_count} steps)"
+        if live:
+            _log(line)
+        else:
+            lines.append(line)
+
+        # Small pause between iterations
+        time.sleep(0.3)
+
+    if lines:
+        _log(*lines)
+    return workflow_results
+
+
 def run_workflow_benchmark(
     tools: list[BrowserTool],
     config: Any,
 ) -> dict:
-    """Run all workflow benchmarks."""
+    """Run all workflow benchmarks.
+
+    Iterations of a workflow on one tool always run back to back, since
+    each tool drives a single browser session. With
+    ``config.parallel_tools > 1`` the tools run each workflow concurrently.
+    """
     results = {
         "workflows": list(WORKFLOWS.keys()),
         "raw_results": [],
@@ -306,61 +324,65 @@ def run_workflow_benchmark(
     }
 
     iterations = config.min_iterations
-
-    # MCP overhead estimate (for comparison)
-    MCP_OVERHEAD_MS = 2300
-
-    for workflow_name, workflow_fn in WORKFLOWS.items():
-        print(f"\n[Workflow: {workflow_name}]")
-
-        for tool in tools:
-            print(f"  [{tool.name}]")
-            workflow_results = []
-
-            for i in range(iterations):
-                wr = workflow_fn(tool, i)
-                workflow_results.append(wr)
-                status = "" if wr.success else ""
-                print(f"    [{i+1}/{iterations}] {status} {wr.total_latency_ms:.0f}ms ({wr.step_count} steps)")
-
-                # Small pause between iterations
-                time.sleep(0.3)
-
-            # Compute summary
-            successful = [w for w in workflow_results if w.success]
-            if successful:
-                latencies = [w.total_latency_ms for w in successful]
-                step_count = successful[0].step_count
-
-                summary = {
-                    "tool": tool.name,
-                    "workflow": workflow_name,
-                    "step_count": step_count,
-                    "iterations": len(workflow_results),
-                    "success_rate": len(successful) / len(workflow_results),
-                    "mean_ms": statistics.mean(latencies),
-                    "median_ms": statistics.median(latencies),
-                    "min_ms": min(latencies),
-                    "max_ms": max(latencies),
-                    "std_dev_ms": statistics.stdev(latencies) if len(latencies) > 1 else 0,
-                    "mcp_estimate_ms": step_count * MCP_OVERHEAD_MS,
-                    "speedup_vs_mcp": (step_count * MCP_OVERHEAD_MS) / statistics.mean(latencies) if latencies else 0,
-                }
-
-                results["summaries"][f"{tool.name}_{workflow_name}"] = summary
-
-            # Store raw results
-            for wr in workflow_results:
-                results["raw_results"].append({
-                    "workflow": wr.workflow_name,
-                    "tool": wr.tool,
-                    "iteration": wr.iteration,
-                    "steps": [s.__dict__ for s in wr.steps],
-                    "total_ms": wr.total_latency_ms,
-                    "step_count": wr.step_count,
-                    "success": wr.success,
-                    "error": wr.error,
-                })
+    parallel = config.parallel_tools > 1 and len(tools) > 1
+
+    # Optional live copy of the raw results, appended per iteration
+    raw_stream = None
+    if config.raw_log:
+        raw_stream = RawResultStream(config.raw_log)
+        results["raw_results_path"] = config.raw_log
+
+    try:
+        for workflow_name, workflow_fn in WORKFLOWS.items():
+            _log(f"\n[Workflow: {workflow_name}]")
+
+            if parallel:
+                with ThreadPoolExecutor(max_workers=config.parallel_tools) as executor:
+                    per_tool = list(executor.map(
+                        lambda tool: _run_iterations(
+                            tool, workflow_fn, iterations, live=False, raw_stream=raw_stream
+                        ),
+                        tools,
+                    ))
+            else:
+                per_tool = [
+                    _run_iterations(tool, workflow_fn, iterations, raw_stream=raw_stream)
+                    for tool in tools
+                ]
+
+            for tool, workflow_results in zip(tools, per_tool):
+                # Compute summary
+                successful = [w for w in workflow_results if w.success]
+                if successful:
+                    # Sorted once for the order statistics; mean and std come
+                    # from a single pass over the same list
+                    latencies = sorted(w.total_latency_ms for w in successful)
+                    step_count = successful[0].step_count
+                    mean_ms, std_ms = _moments(latencies)
+                    mcp_estimate_ms = step_count * MCP_OVERHEAD_MS
+
+                    summary = {
+                        "tool": tool.name,
+                        "workflow": workflow_name,
+                        "step_count": step_count,
+                        "iterations": len(workflow_results),
+                        "success_rate": len(successful) / len(workflow_results),
+                        "mean_ms": mean_ms,
+                        "median_ms": _median(latencies),
+                        "min_ms": latencies[0],
+                        "max_ms": latencies[-1],
+                        "std_dev_ms": std_ms,
+                        "mcp_estimate_ms": mcp_estimate_ms,
+                        "speedup_vs_mcp": mcp_estimate_ms / mean_ms if mean_ms else 0,
+                    }
+
+                    results["summaries"][f"{tool.name}_{workflow_name}"] = summary
+
+                # Store raw results
+                results["raw_results"].extend(_raw_row(wr) for wr in workflow_results)
+    finally:
+        if raw_stream is not None:
+            raw_stream.close()
 
     # Build comparison table
     for workflow_name in WORKFLOWS.keys():
@@ -372,6 +394,7 @@ def run_workflow_benchmark(
                 results["comparison"][workflow_name][tool.name] = {
                     "mean_ms": round(s["mean_ms"], 0),
                     "step_count": s["step_count"],
+                    "mcp_estimate_ms": s["mcp_estimate_ms"],
                     "speedup_vs_mcp": round(s["speedup_vs_mcp"], 1),
                     "success_rate": round(s["success_rate"] * 100, 1),
                 }
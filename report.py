@@ -3,11 +3,17 @@
 from __future__ import annotations
 
 from datetime import datetime
+from functools import lru_cache
 from typing import Any
 
+from benchmarks.workflows import MCP_OVERHEAD_MS
 
-def _fmt_ms(ms: float) -> str:
-    """Format milliseconds for display."""
+
+# Both formatters are pure and see the same handful of values across the
+# report's tables, so their output is memoized
+@lru_cache(maxsize=1024)
+def _fmt_ms(ms: int) -> str:
+    """Format whole milliseconds for display (callers pass ``round(ms)``)."""
     if ms >= 1000:
         return f"{ms/1000:.1f}s"
     return f"{ms:.0f}ms"
@@ -15,11 +21,24 @@ def _fmt_ms(ms: float) -> str:
 
 def _speedup(fast: float, slow: float) -> str:
     """Calculate and format speedup."""
+    return _speedup_cached(round(fast, 1), round(slow, 1))
+
+
+@lru_cache(maxsize=1024)
+def _speedup_cached(fast: float, slow: float) -> str:
     if fast <= 0 or slow <= 0:
         return "-"
     return f"{slow/fast:.1f}x"
 
 
+# Table row templates, with .format bound once for the row loops
+_SINGLE_OP_ROW = "| {op} | {fgp} | {ab} | {mcp} | **{sp}** |".format
+_WORKFLOW_ROW = "| {wf} | {steps} | {fgp} | {ab} | ~{mcp} | **{sp:.1f}x** |".format
+
+# Feature parity statuses as GitHub-compatible table symbols
+_PARITY_SYMBOLS = {"OK": "Yes", "N/A": "-", "FAIL": "No", "ERROR": "Err"}
+
+
 def generate_markdown_report(report: Any) -> str:
     """Generate complete markdown report."""
     lines = []
@@ -51,22 +70,27 @@ def generate_markdown_report(report: Any) -> str:
 
             if fgp_nav > 0 and mcp_nav > 0:
                 speedup_mcp = mcp_nav / fgp_nav
-                lines.append(f"- **{speedup_mcp:.0f}x faster** than Playwright MCP ({_fmt_ms(fgp_nav)} vs {_fmt_ms(mcp_nav)} on navigation)")
+                lines.append(f"- **{speedup_mcp:.0f}x faster** than Playwright MCP ({_fmt_ms(round(fgp_nav))} vs {_fmt_ms(round(mcp_nav))} on navigation)")
 
             if fgp_nav > 0 and ab_nav > 0:
                 speedup_ab = ab_nav / fgp_nav
-                lines.append(f"- **{speedup_ab:.1f}x faster** than agent-browser ({_fmt_ms(fgp_nav)} vs {_fmt_ms(ab_nav)} on navigation)")
+                lines.append(f"- **{speedup_ab:.1f}x faster** than agent-browser ({_fmt_ms(round(fgp_nav))} vs {_fmt_ms(round(ab_nav))} on navigation)")
 
     if report.workflows and "comparison" in report.workflows:
         wf_comp = report.workflows["comparison"]
-        speedups = []
+        # Track the speedup range in a single pass
+        lo = hi = None
         for wf_data in wf_comp.values():
-            if "fgp_browser" in wf_data:
-                s = wf_data["fgp_browser"].get("speedup_vs_mcp", 0)
-                if s > 0:
-                    speedups.append(s)
-        if speedups:
-            lines.append(f"- **{min(speedups):.0f}-{max(speedups):.0f}x faster** on real-world workflows")
+            s = wf_data.get("fgp_browser", {}).get("speedup_vs_mcp", 0)
+            if s > 0:
+                if lo is None:
+                    lo = hi = s
+                elif s < lo:
+                    lo = s
+                elif s > hi:
+                    hi = s
+        if lo is not None:
+            lines.append(f"- **{lo:.0f}-{hi:.0f}x faster** on real-world workflows")
 
     lines.append("")
 
@@ -99,6 +123,7 @@ def generate_markdown_report(report: Any) -> str:
         f"- **Outlier Removal:** {'' if report.config.outlier_removal else 'No'} (>{report.config.outlier_sigma}\u03c3)",
         f"- **Significance Test:** {report.config.significance_test}",
         f"- **Effect Size:** {report.config.effect_size_metric}",
+        f"- **Playwright MCP:** {'one persistent server' if report.config.mcp_persistent else 'new stdio process per call'}",
         "",
     ])
 
@@ -122,17 +147,23 @@ def generate_markdown_report(report: Any) -> str:
                 mcp_str = "N/A*"
                 speedup = "-"
             else:
-                mcp_str = _fmt_ms(mcp)
+                mcp_str = _fmt_ms(round(mcp))
                 speedup = _speedup(fgp, mcp)
 
-            lines.append(
-                f"| {op.replace('_', ' ').title()} | "
-                f"{_fmt_ms(fgp)} | {_fmt_ms(ab)} | {mcp_str} | **{speedup}** |"
-            )
+            lines.append(_SINGLE_OP_ROW(
+                op=op.replace("_", " ").title(),
+                fgp=_fmt_ms(round(fgp)),
+                ab=_fmt_ms(round(ab)),
+                mcp=mcp_str,
+                sp=speedup,
+            ))
 
         lines.append("")
-        lines.append("*MCP stdio is stateless - each call spawns a new process, so operations requiring prior navigation fail.*")
-        lines.append("")
+        if not report.config.mcp_persistent:
+            lines.extend([
+                "*MCP stdio is stateless - each call spawns a new process, so operations requiring prior navigation fail.*",
+                "",
+            ])
 
     # Workflow Benchmarks
     if report.workflows and "comparison" in report.workflows:
@@ -153,14 +184,18 @@ def generate_markdown_report(report: Any) -> str:
             steps = fgp_data.get("step_count", 0)
             fgp = fgp_data.get("mean_ms", 0)
             ab = ab_data.get("mean_ms", 0) if ab_data else 0
-            mcp_est = steps * 2300  # MCP overhead estimate
+            # Stored by run_workflow_benchmark; older results only have the step count
+            mcp_est = fgp_data.get("mcp_estimate_ms", steps * MCP_OVERHEAD_MS)
             speedup = fgp_data.get("speedup_vs_mcp", 0)
 
-            lines.append(
-                f"| {wf.replace('_', ' ').title()} | {steps} | "
-                f"{_fmt_ms(fgp)} | {_fmt_ms(ab) if ab else '-'} | "
-                f"~{_fmt_ms(mcp_est)} | **{speedup:.1f}x** |"
-            )
+            lines.append(_WORKFLOW_ROW(
+                wf=wf.replace("_", " ").title(),
+                steps=steps,
+                fgp=_fmt_ms(round(fgp)),
+                ab=_fmt_ms(round(ab)) if ab else "-",
+                mcp=_fmt_ms(round(mcp_est)),
+                sp=speedup,
+            ))
 
         lines.append("")
 
@@ -178,24 +213,24 @@ def generate_markdown_report(report: Any) -> str:
         # Table header
         header = "| Feature | " + " | ".join(t.replace("_", "-") for t in tools) + " |"
         sep = "|---------|" + "|".join(["-" * 15 for _ in tools]) + "|"
-        lines.append(header)
-        lines.append(sep)
-
-        for feature in features:
-            row = f"| {feature.replace('_', ' ').title()} |"
-            for tool in tools:
-                status = matrix[tool].get(feature, "N/A")
-                # Use GitHub-compatible symbols
-                symbol = {"OK": "Yes", "N/A": "-", "FAIL": "No", "ERROR": "Err"}.get(status, "?")
-                row += f" {symbol} |"
-            lines.append(row)
+        lines.extend((header, sep))
+
+        # Each row's cells are joined once rather than grown cell by cell
+        lines.extend(
+            f"| {feature.replace('_', ' ').title()} | "
+            + " | ".join(_PARITY_SYMBOLS.get(matrix[tool].get(feature, "N/A"), "?") for tool in tools)
+            + " |"
+            for feature in features
+        )
 
         lines.append("")
 
         # Summary
         summary = report.feature_parity.get("summary", {})
-        for tool, data in summary.items():
-            lines.append(f"- **{tool.replace('_', '-')}:** {data['passed']}/{data['total']} features ({data['percentage']}%)")
+        lines.extend(
+            f"- **{tool.replace('_', '-')}:** {data['passed']}/{data['total']} features ({data['percentage']}%)"
+            for tool, data in summary.items()
+        )
         lines.append("")
 
     # Statistical Analysis
@@ -226,7 +261,7 @@ def generate_markdown_report(report: Any) -> str:
         "cargo install fgp-browser",
         "npm install -g @anthropic/agent-browser",
         "",
-        "# Clone and run",
+        "# Clone and run (Python 3.10+)",
         "git clone https://github.com/wolfiesch/fgp-benchmark",
         "cd fgp-benchmark",
         "pip install -r requirements.txt",
@@ -254,6 +289,12 @@ def generate_markdown_report(report: Any) -> str:
         "[Full benchmark results (JSON)](results/latest.json)",
         "",
     ])
+    raw_log = (report.workflows or {}).get("raw_results_path") or (report.single_ops or {}).get("raw_results_path")
+    if raw_log:
+        lines.extend([
+            f"Per-measurement rows were also streamed to `{raw_log}` (JSON Lines).",
+            "",
+        ])
 
     # Footer
     lines.extend([
@@ -4,9 +4,16 @@ from __future__ import annotations
 
 import subprocess
 import time
+from functools import lru_cache
 from shutil import which
 
-from .base import BrowserTool, BenchmarkResult, estimate_tokens
+from .base import BrowserTool, BenchmarkResult, estimate_tokens, key_combo, ms_since
+
+
+@lru_cache(maxsize=1)
+def _find_agent_browser() -> str | None:
+    """Find agent-browser CLI on PATH (looked up once per process)."""
+    return which("agent-browser")
 
 
 class AgentBrowserTool(BrowserTool):
@@ -17,8 +24,9 @@ class AgentBrowserTool(BrowserTool):
     """
 
     def __init__(self):
+        super().__init__()
         self._cold_start = True
-        self._cli_path = which("agent-browser")
+        self._cli_path = _find_agent_browser()
         self._process = None
 
     @property
@@ -47,6 +55,7 @@ class AgentBrowserTool(BrowserTool):
             except Exception:
                 pass
         self._cold_start = True
+        self._reset_session()
 
     def _run_command(
         self,
@@ -57,25 +66,16 @@ class AgentBrowserTool(BrowserTool):
     ) -> BenchmarkResult:
         """Run agent-browser CLI command."""
         if not self.is_available():
-            return BenchmarkResult(
-                tool=self.name,
-                operation=operation,
-                test_case=test_case,
-                iteration=iteration,
-                latency_ms=0,
-                success=False,
-                error="agent-browser CLI not installed",
-            )
+            return BenchmarkResult.failure(self.name, operation, test_case, iteration, "agent-browser CLI not installed")
 
-        start = time.perf_counter()
+        start = time.perf_counter_ns()
         try:
             proc = subprocess.run(
                 [self._cli_path] + args,
                 capture_output=True,
                 timeout=60,
-                text=True,
             )
-            elapsed_ms = (time.perf_counter() - start) * 1000
+            elapsed_ms = ms_since(start)
 
             is_cold = self._cold_start
             self._cold_start = False
@@ -88,30 +88,14 @@ class AgentBrowserTool(BrowserTool):
                 latency_ms=elapsed_ms,
                 success=proc.returncode == 0,
                 is_cold_start=is_cold,
-                payload_size=len(proc.stdout) if proc.stdout else 0,
-                token_estimate=estimate_tokens(proc.stdout or ""),
-                error=proc.stderr[:500] if proc.returncode != 0 else None,
+                payload_size=len(proc.stdout),
+                token_estimate=estimate_tokens(proc.stdout),
+                error=proc.stderr[:500].decode("utf-8", "replace") if proc.returncode != 0 else None,
             )
         except subprocess.TimeoutExpired:
-            return BenchmarkResult(
-                tool=self.name,
-                operation=operation,
-                test_case=test_case,
-                iteration=iteration,
-                latency_ms=60000,
-                success=False,
-                error="Timeout after 60s",
-            )
+            return BenchmarkResult.failure(self.name, operation, test_case, iteration, "Timeout after 60s", latency_ms=60000)
         except Exception as e:
-            return BenchmarkResult(
-                tool=self.name,
-                operation=operation,
-                test_case=test_case,
-                iteration=iteration,
-                latency_ms=0,
-                success=False,
-                error=str(e)[:500],
-            )
+            return BenchmarkResult.failure(self.name, operation, test_case, iteration, str(e)[:500])
 
     def navigate(self, url: str, test_case: str = "default", iteration: int = 0, **kwargs) -> BenchmarkResult:
         return self._run_command(["open", url], "navigate", test_case, iteration)
@@ -151,7 +135,7 @@ class AgentBrowserTool(BrowserTool):
 
     def press_combo(self, modifiers: list[str], key: str, test_case: str = "default", iteration: int = 0, **kwargs) -> BenchmarkResult:
         # Format: Ctrl+a
-        combo = "+".join(modifiers + [key])
+        combo = key_combo(tuple(modifiers), key)
         return self._run_command(["press", combo], "press_combo", test_case, iteration)
 
     def upload(self, selector: str, file_path: str, test_case: str = "default", iteration: int = 0, **kwargs) -> BenchmarkResult:
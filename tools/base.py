@@ -2,19 +2,69 @@
 
 from __future__ import annotations
 
+import time
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Any
 
 
-def estimate_tokens(text: str) -> int:
-    """Rough token estimate (4 chars per token)."""
-    return len(text) // 4
+def _measure_clock_overhead_ns(samples: int = 1000) -> int:
+    """Smallest gap between back-to-back perf_counter_ns() calls."""
+    best = None
+    for _ in range(samples):
+        t0 = time.perf_counter_ns()
+        gap = time.perf_counter_ns() - t0
+        if best is None or gap < best:
+            best = gap
+    return best
 
 
-@dataclass
+# Cost of reading the clock itself, measured once at import and taken off
+# every operation timing so sub-millisecond results aren't inflated by it
+CLOCK_OVERHEAD_NS = _measure_clock_overhead_ns()
+
+
+def ns_between(start_ns: int, end_ns: int) -> int:
+    """Nanoseconds between two time.perf_counter_ns() readings, minus clock overhead."""
+    return max(0, end_ns - start_ns - CLOCK_OVERHEAD_NS)
+
+
+def ns_since(start_ns: int) -> int:
+    """Nanoseconds since a time.perf_counter_ns() reading, minus clock overhead."""
+    return ns_between(start_ns, time.perf_counter_ns())
+
+
+def ms_since(start_ns: int) -> float:
+    """Milliseconds since a time.perf_counter_ns() reading, minus clock overhead."""
+    return ns_since(start_ns) / 1_000_000
+
+
+def estimate_tokens(data: str | bytes | None) -> int:
+    """Rough token estimate (4 chars or bytes per token).
+
+    Only a sizing ceiling, so raw bytes are counted as-is and captured
+    output never needs decoding first.
+    """
+    return 0 if data is None else len(data) >> 2
+
+
+@lru_cache(maxsize=64)
+def key_combo(modifiers: tuple[str, ...], key: str) -> str:
+    """Playwright-style combo string, e.g. ``("Control",), "a"`` -> "Control+a"."""
+    return "+".join((*modifiers, key))
+
+
+@dataclass(slots=True, frozen=True, eq=False)
 class BenchmarkResult:
-    """Result of a single benchmark operation."""
+    """Result of a single benchmark operation.
+
+    Thousands are created per run, so instances are slotted (no per-instance
+    ``__dict__``, which needs Python 3.10+) and their fields can't be
+    reassigned once measured. ``metadata`` is a plain dict, so results
+    compare and hash by identity rather than by value.
+    """
     tool: str
     operation: str
     test_case: str
@@ -27,10 +77,35 @@ class BenchmarkResult:
     error: str | None = None
     metadata: dict = field(default_factory=dict)
 
+    @classmethod
+    def failure(
+        cls,
+        tool: str,
+        operation: str,
+        test_case: str,
+        iteration: int,
+        error: str,
+        latency_ms: float = 0,
+    ) -> BenchmarkResult:
+        """Result for an operation that failed (or never ran)."""
+        return cls(tool, operation, test_case, iteration, latency_ms, False, error=error)
+
 
 class BrowserTool(ABC):
     """Abstract base class for browser automation tools."""
 
+    def __init__(self) -> None:
+        # Session state shared across benchmark operations: operations that
+        # have already been warmed up, and the page a benchmark setup step
+        # last left the browser on. Cleared by _reset_session() on stop().
+        self.warmed_ops: set[str] = set()
+        self.current_url: str | None = None
+
+    def _reset_session(self) -> None:
+        """Forget warmup and page state once the browser goes away."""
+        self.warmed_ops.clear()
+        self.current_url = None
+
     @property
     @abstractmethod
     def name(self) -> str:
@@ -112,6 +187,37 @@ class BrowserTool(ABC):
         """Upload file to file input."""
         pass
 
+    def run_batch(self, calls: list[tuple[str, dict]], max_workers: int = 8) -> list[BenchmarkResult]:
+        """Run independent (method, kwargs) calls concurrently, e.g. ("navigate", {"url": u}).
+
+        Results come back in the order the calls were given. Every call
+        drives the same browser, so only batch calls that don't depend on
+        each other's page state. Transports that carry one request at a
+        time (the persistent MCP pipe) still run the calls one by one.
+        """
+        if not calls:
+            return []
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(calls))) as executor:
+            return list(executor.map(lambda call: getattr(self, call[0])(**call[1]), calls))
+
+    def reset(self) -> None:
+        """Return the live browser to a blank page between benchmark phases.
+
+        Cheaper than a stop()/start() cycle: the browser process and tab
+        stay up, only the page state left by the previous phase goes away.
+        """
+        self.navigate("about:blank", test_case="reset")
+        self.current_url = None
+
+    def settle(self, seconds: float = 0.05) -> None:
+        """Pause for a fixed ``seconds`` to let the page settle.
+
+        Tool calls are synchronous, so nothing is still in flight once they
+        return; this is only a short fixed delay between steps, not a
+        readiness check.
+        """
+        time.sleep(seconds)
+
     def close(self) -> None:
         """Cleanup resources."""
         pass
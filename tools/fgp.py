@@ -2,17 +2,162 @@
 
 from __future__ import annotations
 
+import itertools
 import json
 import os
+import select
 import signal
 import socket
 import subprocess
+import threading
 import time
-import uuid
+from functools import lru_cache
 from pathlib import Path
 from shutil import which
 
-from .base import BrowserTool, BenchmarkResult, estimate_tokens
+from .base import BrowserTool, BenchmarkResult, estimate_tokens, ms_since, ns_between
+
+# orjson is optional; it encodes request params faster than json
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+
+def _dumps(obj: dict) -> bytes:
+    """Compact JSON encoding of request params."""
+    if HAS_ORJSON:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":")).encode()
+
+
+@lru_cache(maxsize=None)
+def _method_json(method: str) -> bytes:
+    """JSON-encoded method name (a small fixed set, so encoded once each)."""
+    return json.dumps(method).encode()
+
+
+def _wait_until(condition, timeout: float, interval: float = 0.001, max_interval: float = 0.05) -> bool:
+    """Poll ``condition`` until it holds or ``timeout`` seconds pass.
+
+    The poll interval starts short and doubles up to ``max_interval``, so
+    quick transitions (a daemon exiting on SIGTERM) are seen within a
+    millisecond or two without spinning through a slow browser launch.
+    """
+    deadline = time.perf_counter() + timeout
+    while not condition():
+        remaining = deadline - time.perf_counter()
+        if remaining <= 0:
+            return False
+        time.sleep(min(interval, remaining))
+        interval = min(interval * 2, max_interval)
+    return True
+
+
+def _pid_alive(pid: int) -> bool:
+    """Whether a process with this PID still exists."""
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        pass
+    return True
+
+
+@lru_cache(maxsize=1)
+def _find_browser_gateway() -> str | None:
+    """Find browser-gateway CLI (looked up once per process)."""
+    # Check PATH
+    cli = which("browser-gateway")
+    if cli:
+        return cli
+
+    # Check FGP project directory
+    fgp_cli = Path.home() / "projects" / "fgp" / "browser" / "target" / "release" / "browser-gateway"
+    if fgp_cli.exists():
+        return str(fgp_cli)
+
+    return None
+
+
+# Error codes/messages a daemon may use for a method it doesn't implement
+_UNKNOWN_METHOD_CODES = {"METHOD_NOT_FOUND", "UNKNOWN_METHOD", -32601}
+_UNKNOWN_METHOD_MESSAGES = ("unknown method", "method not found")
+
+
+def _response_status(response_data: bytes) -> tuple[bool, str | None]:
+    """Whether a daemon response reports success, and its error if not."""
+    try:
+        response = json.loads(response_data)
+    except ValueError as e:
+        return False, f"Bad daemon response: {e}"[:500]
+    if response.get("ok"):
+        return True, None
+    return False, str(response.get("error", {}).get("message", "Unknown error"))[:500]
+
+
+def _unknown_method(response_data: bytes) -> bool:
+    """Whether a failed daemon response rejects the method itself (so the
+    request was not run)."""
+    try:
+        error = json.loads(response_data).get("error") or {}
+    except ValueError:
+        return False
+    if not isinstance(error, dict):
+        return False
+    if error.get("code") in _UNKNOWN_METHOD_CODES:
+        return True
+    message = str(error.get("message", "")).lower()
+    return any(m in message for m in _UNKNOWN_METHOD_MESSAGES)
+
+
+class _ResponseLost(Exception):
+    """The request was sent, but its response couldn't be read.
+
+    Deliberately not an OSError: the daemon may already have run the
+    request, so callers must not resend it or fall back to the CLI.
+    """
+
+
+class _Conn:
+    """A pooled daemon connection and its receive buffer.
+
+    ``buf[start:end]`` holds bytes already read past the last response.
+    """
+
+    __slots__ = ("sock", "buf", "start", "end")
+
+    def __init__(self, sock: socket.socket, size: int):
+        self.sock = sock
+        self.buf = bytearray(size)
+        self.start = 0
+        self.end = 0
+
+    def stale(self) -> bool:
+        """Whether an idle connection was closed by the daemon.
+
+        An idle connection has nothing to read, so a readable socket means
+        EOF (or stray data); either way it can't carry a new request.
+        """
+        try:
+            return bool(select.select([self.sock], [], [], 0)[0])
+        except (OSError, ValueError):
+            return True
+
+
+class _RpcRecorder:
+    """Stands in for the tool when an operation is called, capturing the
+    arguments it would pass to _rpc instead of sending anything."""
+
+    __slots__ = ("calls",)
+
+    def __init__(self):
+        self.calls: list[tuple] = []
+
+    def _rpc(self, *args) -> None:
+        self.calls.append(args)
 
 
 class FGPBrowserTool(BrowserTool):
@@ -22,25 +167,38 @@ class FGPBrowserTool(BrowserTool):
     """
 
     SOCKET_PATH = Path.home() / ".fgp" / "services" / "browser" / "daemon.sock"
+    PID_PATH = Path.home() / ".fgp" / "services" / "browser" / "daemon.pid"
 
-    def __init__(self):
-        self._cold_start = True
-        self._daemon_pid: int | None = None
-        self._cli_path = self._find_cli()
+    # Upper bounds on waiting for the daemon to come up / go away; the
+    # waits poll and return as soon as the daemon is ready
+    START_TIMEOUT = 3.0
+    STOP_TIMEOUT = 0.5
 
-    def _find_cli(self) -> str | None:
-        """Find browser-gateway CLI."""
-        # Check PATH
-        cli = which("browser-gateway")
-        if cli:
-            return cli
+    # Seconds a daemon request may block, matching the CLI's subprocess
+    # timeout so a stalled daemon fails the call instead of hanging the run
+    TIMEOUT = 60
 
-        # Check FGP project directory
-        fgp_cli = Path.home() / "projects" / "fgp" / "browser" / "target" / "release" / "browser-gateway"
-        if fgp_cli.exists():
-            return str(fgp_cli)
+    # Socket read size; large enough that most snapshot responses arrive in
+    # one or two reads
+    RECV_SIZE = 1 << 20
 
-        return None
+    def __init__(self):
+        super().__init__()
+        self._cold_start = True
+        self._daemon_pid: int | None = None
+        self._cli_path = _find_browser_gateway()
+        # Set once a request reaches the daemon, so operations skip the
+        # socket-file stat; cleared when the connection fails or on stop()
+        self._socket_ok = False
+        # Idle keep-alive connections. A call takes one (or opens a new one)
+        # and returns it afterwards, so concurrent calls don't share a socket.
+        self._idle_conns: list[_Conn] = []
+        self._pool_lock = threading.Lock()
+        # Request ids only need to be unique per connection; a counter is
+        # cheaper than a UUID per call
+        self._req_ids = itertools.count(1)
+        # Methods the daemon rejected as unknown; these go to the CLI
+        self._cli_methods: set[str] = set()
 
     @property
     def name(self) -> str:
@@ -54,9 +212,9 @@ class FGPBrowserTool(BrowserTool):
         if not self._cli_path:
             return False
 
-        # Stop any existing daemon
+        # Stop any existing daemon and wait for its socket to go away
         self.stop()
-        time.sleep(0.5)
+        _wait_until(lambda: not self.SOCKET_PATH.exists(), self.STOP_TIMEOUT)
 
         # Start daemon
         try:
@@ -65,19 +223,22 @@ class FGPBrowserTool(BrowserTool):
                 stdout=subprocess.DEVNULL,
                 stderr=subprocess.DEVNULL,
             )
-            time.sleep(2)  # Wait for daemon to start
+            # Wait for daemon to start listening
+            if not _wait_until(self.SOCKET_PATH.exists, self.START_TIMEOUT):
+                return False
 
-            # Get PID from pidfile
-            pidfile = Path.home() / ".fgp" / "services" / "browser" / "daemon.pid"
-            if pidfile.exists():
-                self._daemon_pid = int(pidfile.read_text().strip())
+            # Get PID from pidfile (may land just after the socket)
+            if _wait_until(self.PID_PATH.exists, self.STOP_TIMEOUT):
+                self._daemon_pid = int(self.PID_PATH.read_text().strip())
 
-            return self.SOCKET_PATH.exists()
+            return True
         except Exception:
             return False
 
     def stop(self) -> None:
         """Stop the FGP Browser daemon."""
+        self._close_conns()
+
         if self._cli_path:
             try:
                 subprocess.run(
@@ -90,40 +251,160 @@ class FGPBrowserTool(BrowserTool):
 
         # Force kill if PID known
         if self._daemon_pid:
+            pid = self._daemon_pid
             try:
-                os.kill(self._daemon_pid, signal.SIGTERM)
+                os.kill(pid, signal.SIGTERM)
+                _wait_until(lambda: not _pid_alive(pid), self.STOP_TIMEOUT)
             except ProcessLookupError:
                 pass
             self._daemon_pid = None
 
         self._cold_start = True
+        self._socket_ok = False
+        self._reset_session()
 
-    def _call(self, method: str, params: dict | None = None) -> tuple[dict, float]:
-        """Call FGP method via Unix socket."""
-        start = time.perf_counter()
+    def _connect(self) -> _Conn:
+        """Open a new daemon connection."""
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(self.TIMEOUT)
+        try:
+            sock.connect(str(self.SOCKET_PATH))
+        except OSError:
+            sock.close()
+            raise
+        return _Conn(sock, self.RECV_SIZE)
+
+    def _acquire_conn(self) -> _Conn:
+        """Take a live idle connection from the pool, or open a new one."""
+        while True:
+            with self._pool_lock:
+                if not self._idle_conns:
+                    break
+                conn = self._idle_conns.pop()
+            if not conn.stale():
+                return conn
+            conn.sock.close()
+        return self._connect()
+
+    def _release_conn(self, conn: _Conn) -> None:
+        """Return a healthy connection to the pool."""
+        with self._pool_lock:
+            self._idle_conns.append(conn)
+
+    def _close_conns(self) -> None:
+        """Close every idle connection (new ones are opened on demand)."""
+        with self._pool_lock:
+            conns, self._idle_conns = self._idle_conns, []
+        for conn in conns:
+            try:
+                conn.sock.close()
+            except OSError:
+                pass
 
-        request = {
-            "id": str(uuid.uuid4()),
-            "v": 1,
-            "method": method,
-            "params": params or {},
-        }
+    def _read_line(self, conn: _Conn) -> bytes:
+        """Read one newline-framed response from a connection."""
+        buf = conn.buf
+        # Data is received straight into the connection's buffer, and only
+        # the newly received bytes are searched for the delimiter, so a
+        # large response is neither re-copied per chunk nor re-scanned
+        scanned = conn.start
+        while (nl := buf.find(b"\n", scanned, conn.end)) < 0:
+            scanned = conn.end
+            if conn.end == len(buf):
+                if conn.start:
+                    # Move the partial response to the front
+                    size = conn.end - conn.start
+                    buf[:size] = buf[conn.start:conn.end]
+                    scanned -= conn.start
+                    conn.start, conn.end = 0, size
+                else:
+                    buf.extend(bytes(len(buf)))
+            with memoryview(buf) as view:
+                n = conn.sock.recv_into(view[conn.end:])
+            if not n:
+                raise ConnectionResetError("FGP daemon closed the connection")
+            conn.end += n
+        with memoryview(buf) as view:
+            line = view[conn.start:nl].tobytes()
+        if nl + 1 == conn.end:
+            conn.start = conn.end = 0
+        else:
+            conn.start = nl + 1
+        return line
 
-        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
-        sock.connect(str(self.SOCKET_PATH))
-        sock.sendall((json.dumps(request) + "\n").encode())
+    def _send(self, payload: bytes) -> _Conn:
+        """Send newline-framed request(s) and return the connection used.
 
-        response_data = b""
-        while True:
-            chunk = sock.recv(65536)
-            if not chunk:
-                break
-            response_data += chunk
-            if b"\n" in response_data:
-                break
+        Raises OSError only when nothing reached the daemon: a connection
+        dropped while idle is replaced and the send retried once. A partial
+        send leaves an unterminated line, which the daemon never runs.
+        TimeoutError (a stalled daemon) is raised without a retry.
+        """
+        try:
+            conn = self._acquire_conn()
+            try:
+                conn.sock.sendall(payload)
+            except TimeoutError:
+                conn.sock.close()
+                raise
+            except OSError:
+                conn.sock.close()
+                conn = self._connect()
+                try:
+                    conn.sock.sendall(payload)
+                except OSError:
+                    conn.sock.close()
+                    raise
+        except OSError:
+            self._socket_ok = False
+            raise
+        return conn
+
+    def _receive(self, conn: _Conn) -> bytes:
+        """Read one response line for a request already sent on ``conn``."""
+        try:
+            return self._read_line(conn)
+        except TimeoutError:
+            conn.sock.close()
+            self._socket_ok = False
+            raise
+        except OSError as e:
+            conn.sock.close()
+            self._socket_ok = False
+            raise _ResponseLost(str(e) or type(e).__name__) from e
+
+    def _envelope(self, method: str, params: dict | None) -> bytes:
+        """Encode one request line."""
+        # Only the id and params vary; the envelope is assembled from
+        # pre-encoded pieces rather than dumping a fresh dict per call
+        return b"".join((
+            b'{"id":"', str(next(self._req_ids)).encode(),
+            b'","v":1,"method":', _method_json(method),
+            b',"params":', _dumps(params or {}), b"}\n",
+        ))
+
+    def _request(self, method: str, params: dict | None = None) -> bytes:
+        """Send one RPC request and return the raw response line.
+
+        Connections are kept open across calls. Raises TimeoutError if the
+        daemon stalls, OSError if the request couldn't be sent, and
+        _ResponseLost if it was sent but no response came back.
+        """
+        conn = self._send(self._envelope(method, params))
+        line = self._receive(conn)
+        self._release_conn(conn)
+        self._socket_ok = True
+        return line
+
+    def _daemon_reachable(self) -> bool:
+        """Whether the daemon socket is there (cached after a successful call)."""
+        return self._socket_ok or self.SOCKET_PATH.exists()
 
-        sock.close()
-        latency_ms = (time.perf_counter() - start) * 1000
+    def _call(self, method: str, params: dict | None = None) -> tuple[dict, float]:
+        """Call FGP method via Unix socket."""
+        start = time.perf_counter_ns()
+        response_data = self._request(method, params)
+        latency_ms = ms_since(start)
 
         response = json.loads(response_data.decode().strip())
         if not response.get("ok"):
@@ -131,6 +412,148 @@ class FGPBrowserTool(BrowserTool):
 
         return response.get("result", {}), latency_ms
 
+    def _rpc(
+        self,
+        method: str,
+        params: dict,
+        operation: str,
+        test_case: str,
+        iteration: int,
+        cli_args: list[str],
+    ) -> BenchmarkResult:
+        """Run an operation over the daemon socket.
+
+        Falls back to the equivalent browser-gateway CLI command only when
+        the request never reached the daemon (no socket, connect or send
+        failed) or the daemon rejected the method as unknown. Once a
+        request is sent, losing the connection is recorded as a failure:
+        the daemon may have run it, so it is not repeated. A stalled daemon
+        fails the call after TIMEOUT seconds, like the CLI's timeout.
+        """
+        if method in self._cli_methods or not self._daemon_reachable():
+            return self._run_command(cli_args, operation, test_case, iteration)
+
+        start = time.perf_counter_ns()
+        try:
+            response_data = self._request(method, params)
+        except TimeoutError:
+            return self._timeout_result(operation, test_case, iteration)
+        except _ResponseLost as e:
+            return BenchmarkResult.failure(
+                self.name, operation, test_case, iteration,
+                f"Daemon connection lost: {e}"[:500], latency_ms=ms_since(start),
+            )
+        except OSError:
+            return self._run_command(cli_args, operation, test_case, iteration)
+
+        ok, error = _response_status(response_data)
+        elapsed_ms = ms_since(start)
+        if not ok and _unknown_method(response_data):
+            self._cli_methods.add(method)
+            return self._run_command(cli_args, operation, test_case, iteration)
+        return self._rpc_result(response_data, elapsed_ms, ok, error, operation, test_case, iteration)
+
+    def _timeout_result(self, operation: str, test_case: str, iteration: int) -> BenchmarkResult:
+        """The failure recorded when the daemon doesn't answer in time."""
+        return BenchmarkResult.failure(
+            self.name, operation, test_case, iteration,
+            f"Timeout after {self.TIMEOUT}s", latency_ms=self.TIMEOUT * 1000,
+        )
+
+    def _rpc_result(
+        self,
+        response_data: bytes,
+        latency_ms: float,
+        ok: bool,
+        error: str | None,
+        operation: str,
+        test_case: str,
+        iteration: int,
+    ) -> BenchmarkResult:
+        """Build the result for one daemon response."""
+        is_cold = self._cold_start
+        self._cold_start = False
+
+        return BenchmarkResult(
+            tool=self.name,
+            operation=operation,
+            test_case=test_case,
+            iteration=iteration,
+            latency_ms=latency_ms,
+            success=ok,
+            is_cold_start=is_cold,
+            payload_size=len(response_data),
+            token_estimate=estimate_tokens(response_data),
+            error=error,
+        )
+
+    def run_batch(self, calls: list[tuple[str, dict]], max_workers: int = 8) -> list[BenchmarkResult]:
+        """Pipeline (method, kwargs) calls over one daemon connection.
+
+        Every request is written in a single send and the responses are
+        read back in order, so the batch pays one round-trip instead of one
+        per call. Each result's latency is the time since the previous
+        response arrived (the first also covers the send). The daemon runs
+        the requests in order, but, as with the base class, only batch
+        calls that don't depend on each other's outcome: a failed call does
+        not stop the ones after it. Falls back to the base behaviour when
+        the batch can't be sent, or when it uses a method the daemon has
+        rejected as unknown.
+        """
+        if not calls or not self._daemon_reachable():
+            return super().run_batch(calls, max_workers)
+
+        # Run each operation against a recorder to get the requests it sends
+        recorder = _RpcRecorder()
+        for name, kwargs in calls:
+            getattr(FGPBrowserTool, name)(recorder, **kwargs)
+        if any(method in self._cli_methods for method, *_ in recorder.calls):
+            return super().run_batch(calls, max_workers)
+        payload = b"".join(self._envelope(method, params) for method, params, *_ in recorder.calls)
+
+        results = []
+        start = time.perf_counter_ns()
+        try:
+            conn = self._send(payload)
+        except TimeoutError:
+            return [self._timeout_result(op, tc, it) for _, _, op, tc, it, _ in recorder.calls]
+        except OSError:
+            return super().run_batch(calls, max_workers)
+
+        prev = start
+        rejected = []
+        for i, (method, _, operation, test_case, iteration, _) in enumerate(recorder.calls):
+            try:
+                response_data = self._receive(conn)
+            except TimeoutError:
+                results.extend(self._timeout_result(op, tc, it) for _, _, op, tc, it, _ in recorder.calls[i:])
+                return results
+            except _ResponseLost as e:
+                # The daemon may have run the rest, so don't resend it
+                results.extend(
+                    BenchmarkResult.failure(self.name, op, tc, it, f"Batch connection lost: {e}"[:500])
+                    for _, _, op, tc, it, _ in recorder.calls[i:]
+                )
+                return results
+            self._socket_ok = True
+            ok, error = _response_status(response_data)
+            if not ok and _unknown_method(response_data):
+                self._cli_methods.add(method)
+                rejected.append(i)
+            now = time.perf_counter_ns()
+            results.append(self._rpc_result(
+                response_data, ns_between(prev, now) / 1_000_000, ok, error, operation, test_case, iteration,
+            ))
+            prev = now
+
+        self._release_conn(conn)
+        # The daemon didn't run these, so they are run through the CLI once
+        # the batch is done (keeping CLI time out of the batched latencies)
+        for i in rejected:
+            _, _, operation, test_case, iteration, cli_args = recorder.calls[i]
+            results[i] = self._run_command(cli_args, operation, test_case, iteration)
+        return results
+
     def _run_command(
         self,
         args: list[str],
@@ -139,26 +562,17 @@ class FGPBrowserTool(BrowserTool):
         iteration: int = 0,
     ) -> BenchmarkResult:
         """Run browser-gateway CLI command."""
-        if not self.SOCKET_PATH.exists():
-            return BenchmarkResult(
-                tool=self.name,
-                operation=operation,
-                test_case=test_case,
-                iteration=iteration,
-                latency_ms=0,
-                success=False,
-                error="Daemon not running",
-            )
+        if not self._daemon_reachable():
+            return BenchmarkResult.failure(self.name, operation, test_case, iteration, "Daemon not running")
 
-        start = time.perf_counter()
+        start = time.perf_counter_ns()
         try:
             proc = subprocess.run(
                 [self._cli_path] + args,
                 capture_output=True,
                 timeout=60,
-                text=True,
             )
-            elapsed_ms = (time.perf_counter() - start) * 1000
+            elapsed_ms = ms_since(start)
 
             is_cold = self._cold_start
             self._cold_start = False
@@ -171,84 +585,83 @@ class FGPBrowserTool(BrowserTool):
                 latency_ms=elapsed_ms,
                 success=proc.returncode == 0,
                 is_cold_start=is_cold,
-                payload_size=len(proc.stdout) if proc.stdout else 0,
-                token_estimate=estimate_tokens(proc.stdout or ""),
-                error=proc.stderr[:500] if proc.returncode != 0 else None,
+                payload_size=len(proc.stdout),
+                token_estimate=estimate_tokens(proc.stdout),
+                error=proc.stderr[:500].decode("utf-8", "replace") if proc.returncode != 0 else None,
             )
         except subprocess.TimeoutExpired:
-            return BenchmarkResult(
-                tool=self.name,
-                operation=operation,
-                test_case=test_case,
-                iteration=iteration,
-                latency_ms=60000,
-                success=False,
-                error="Timeout after 60s",
-            )
+            return BenchmarkResult.failure(self.name, operation, test_case, iteration, "Timeout after 60s", latency_ms=60000)
         except Exception as e:
-            return BenchmarkResult(
-                tool=self.name,
-                operation=operation,
-                test_case=test_case,
-                iteration=iteration,
-                latency_ms=0,
-                success=False,
-                error=str(e)[:500],
-            )
+            return BenchmarkResult.failure(self.name, operation, test_case, iteration, str(e)[:500])
 
     def navigate(self, url: str, test_case: str = "default", iteration: int = 0, **kwargs) -> BenchmarkResult:
-        return self._run_command(["open", url], "navigate", test_case, iteration)
+        return self._rpc("browser.open", {"url": url}, "navigate", test_case, iteration, ["open", url])
 
     def snapshot(self, test_case: str = "default", iteration: int = 0, **kwargs) -> BenchmarkResult:
-        return self._run_command(["snapshot"], "snapshot", test_case, iteration)
+        return self._rpc("browser.snapshot", {}, "snapshot", test_case, iteration, ["snapshot"])
 
     def screenshot(self, path: str, test_case: str = "default", iteration: int = 0, **kwargs) -> BenchmarkResult:
-        return self._run_command(["screenshot", path], "screenshot", test_case, iteration)
+        return self._rpc("browser.screenshot", {"path": path}, "screenshot", test_case, iteration, ["screenshot", path])
 
     def click(self, selector: str, test_case: str = "default", iteration: int = 0, **kwargs) -> BenchmarkResult:
-        return self._run_command(["click", selector], "click", test_case, iteration)
+        return self._rpc("browser.click", {"selector": selector}, "click", test_case, iteration, ["click", selector])
 
     def fill(self, selector: str, value: str, test_case: str = "default", iteration: int = 0, **kwargs) -> BenchmarkResult:
-        return self._run_command(["fill", selector, value], "fill", test_case, iteration)
+        return self._rpc(
+            "browser.fill", {"selector": selector, "value": value}, "fill", test_case, iteration,
+            ["fill", selector, value],
+        )
 
     def select(self, selector: str, value: str, test_case: str = "default", iteration: int = 0, **kwargs) -> BenchmarkResult:
-        return self._run_command(["select", selector, value], "select", test_case, iteration)
+        return self._rpc(
+            "browser.select", {"selector": selector, "value": value}, "select", test_case, iteration,
+            ["select", selector, value],
+        )
 
     def check(self, selector: str, checked: bool = True, test_case: str = "default", iteration: int = 0, **kwargs) -> BenchmarkResult:
         args = ["check", selector]
         if not checked:
             args.append("--uncheck")
-        return self._run_command(args, "check", test_case, iteration)
+        return self._rpc(
+            "browser.check", {"selector": selector, "checked": checked}, "check", test_case, iteration, args,
+        )
 
     def hover(self, selector: str, test_case: str = "default", iteration: int = 0, **kwargs) -> BenchmarkResult:
-        return self._run_command(["hover", selector], "hover", test_case, iteration)
+        return self._rpc("browser.hover", {"selector": selector}, "hover", test_case, iteration, ["hover", selector])
 
     def scroll(self, selector: str | None = None, x: int = 0, y: int = 0, test_case: str = "default", iteration: int = 0, **kwargs) -> BenchmarkResult:
         if selector:
-            return self._run_command(["scroll", selector], "scroll", test_case, iteration)
+            return self._rpc(
+                "browser.scroll", {"selector": selector}, "scroll", test_case, iteration, ["scroll", selector],
+            )
         else:
             args = ["scroll"]
             if x:
                 args.extend(["--x", str(x)])
             if y:
                 args.extend(["--y", str(y)])
-            return self._run_command(args, "scroll", test_case, iteration)
+            return self._rpc("browser.scroll", {"x": x, "y": y}, "scroll", test_case, iteration, args)
 
     def press(self, key: str, test_case: str = "default", iteration: int = 0, **kwargs) -> BenchmarkResult:
-        return self._run_command(["press", key], "press", test_case, iteration)
+        return self._rpc("browser.press", {"key": key}, "press", test_case, iteration, ["press", key])
 
     def press_combo(self, modifiers: list[str], key: str, test_case: str = "default", iteration: int = 0, **kwargs) -> BenchmarkResult:
         args = ["press-combo", "--key", key]
         for mod in modifiers:
             args.extend(["--modifiers", mod])
-        return self._run_command(args, "press_combo", test_case, iteration)
+        return self._rpc(
+            "browser.press_combo", {"modifiers": modifiers, "key": key}, "press_combo", test_case, iteration, args,
+        )
 
     def upload(self, selector: str, file_path: str, test_case: str = "default", iteration: int = 0, **kwargs) -> BenchmarkResult:
-        return self._run_command(["upload", selector, file_path], "upload", test_case, iteration)
+        return self._rpc(
+            "browser.upload", {"selector": selector, "path": file_path}, "upload", test_case, iteration,
+            ["upload", selector, file_path],
+        )
 
     def close(self) -> None:
-        """Keep daemon running for next benchmark."""
-        pass
+        """Keep daemon running for next benchmark; only drop our connections."""
+        self._close_conns()
 
     def get_pid(self) -> int | None:
         return self._daemon_pid
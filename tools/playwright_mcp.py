@@ -4,10 +4,49 @@ from __future__ import annotations
 
 import json
 import subprocess
+import threading
 import time
 from shutil import which
 
-from .base import BrowserTool, BenchmarkResult, estimate_tokens
+from .base import BrowserTool, BenchmarkResult, estimate_tokens, key_combo, ms_since
+
+# orjson is optional; it decodes large snapshot responses faster than json
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+
+def _loads(data: bytes | str):
+    """Decode one JSON document."""
+    if HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _find_response(stdout: bytes, req_id: int) -> dict | None:
+    """Return the JSON-RPC response with ``req_id`` from raw server output.
+
+    The server may log other lines first, so the output is scanned from the
+    end, where the response lands, and lines that aren't it are skipped.
+    Lines are cut out one at a time with rfind, so in the usual case only
+    the last line is ever copied rather than the whole output being split.
+    """
+    end = len(stdout)
+    while end > 0:
+        begin = stdout.rfind(b"\n", 0, end) + 1
+        line = stdout[begin:end].strip()
+        end = begin - 1
+        if not line.startswith(b"{"):
+            continue
+        try:
+            response = _loads(line)
+        except ValueError:
+            continue
+        if isinstance(response, dict) and response.get("id") == req_id:
+            return response
+    return None
 
 
 class PlaywrightMCPTool(BrowserTool):
@@ -19,11 +58,24 @@ class PlaywrightMCPTool(BrowserTool):
     Note: This measures the REAL-WORLD performance of MCP stdio,
     including process spawn overhead. This is intentional - it's how
     the tool is actually used.
+
+    With ``persistent=True`` the server is instead launched once and kept
+    running, and every call is a JSON-RPC request over its stdin/stdout.
+    Calls are then serialized on the one pipe, and page state carries
+    over between calls like it does for the daemon-based tools.
     """
 
-    def __init__(self):
+    # Seconds a persistent-server request may take before the server is killed
+    CALL_TIMEOUT = 60
+
+    def __init__(self, persistent: bool = False):
+        super().__init__()
         self._cold_start = True
         self._npx_path = which("npx")
+        self._persistent = persistent
+        self._process: subprocess.Popen | None = None
+        self._req_id = 0
+        self._lock = threading.Lock()
 
     @property
     def name(self) -> str:
@@ -33,13 +85,160 @@ class PlaywrightMCPTool(BrowserTool):
         return self._npx_path is not None
 
     def start(self) -> bool:
-        """No persistent daemon for MCP stdio."""
+        """Launch the persistent server if enabled (per-call mode has none)."""
         self._cold_start = True
+        if not self._persistent:
+            return True
+        with self._lock:
+            try:
+                self._ensure_server()
+            except Exception:
+                self._shutdown_server()
+                return False
         return True
 
     def stop(self) -> None:
-        """No persistent daemon for MCP stdio."""
+        """Shut down the persistent server, if one is running."""
+        with self._lock:
+            self._shutdown_server()
         self._cold_start = True
+        self._reset_session()
+
+    def reset(self) -> None:
+        """Blank the page on a persistent server.
+
+        In per-call mode every MCP stdio call runs in a fresh process, so
+        there is nothing to reset.
+        """
+        if self._persistent:
+            super().reset()
+        else:
+            self.current_url = None
+
+    def _send(self, message: dict) -> None:
+        """Write one line-delimited JSON-RPC message to the server."""
+        self._process.stdin.write(json.dumps(message) + "\n")
+        self._process.stdin.flush()
+
+    def _request(self, method: str, params: dict) -> tuple[dict, str]:
+        """Send a request and read lines until its response arrives.
+
+        Returns the parsed response and its raw line. Notifications and
+        other non-matching lines are skipped. A watchdog kills the server
+        if no response arrives within CALL_TIMEOUT, which ends the read.
+        """
+        self._req_id += 1
+        req_id = self._req_id
+        # Only the id, method and params are encoded per call
+        self._process.stdin.write(
+            f'{{"jsonrpc":"2.0","id":{req_id},"method":{json.dumps(method)},"params":{json.dumps(params)}}}\n'
+        )
+        self._process.stdin.flush()
+
+        watchdog = threading.Timer(self.CALL_TIMEOUT, self._process.kill)
+        watchdog.start()
+        try:
+            while True:
+                line = self._process.stdout.readline()
+                if not line:
+                    if not watchdog.is_alive():
+                        raise subprocess.TimeoutExpired(method, self.CALL_TIMEOUT)
+                    raise ConnectionError("MCP server exited")
+                if not line.startswith("{"):
+                    continue
+                try:
+                    response = _loads(line)
+                except ValueError:
+                    continue
+                # Valid JSON that isn't an object can't be the response
+                if not isinstance(response, dict):
+                    continue
+                if response.get("id") == req_id:
+                    return response, line
+        finally:
+            watchdog.cancel()
+
+    def _ensure_server(self) -> None:
+        """Launch the server and complete the MCP handshake if not running."""
+        if self._process is not None and self._process.poll() is None:
+            return
+        self._process = subprocess.Popen(
+            [self._npx_path, "@playwright/mcp@latest"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            bufsize=1,
+        )
+        self._cold_start = True
+        self._req_id = 0
+        self._request("initialize", {
+            "protocolVersion": "2024-11-05",
+            "capabilities": {},
+            "clientInfo": {"name": "fgp-benchmark", "version": "1.0.0"},
+        })
+        self._send({"jsonrpc": "2.0", "method": "notifications/initialized"})
+
+    def _shutdown_server(self) -> None:
+        """Close the server's stdin (the MCP stdio shutdown) and reap it."""
+        if self._process is None:
+            return
+        proc, self._process = self._process, None
+        try:
+            proc.stdin.close()
+            proc.wait(timeout=5)
+        except Exception:
+            proc.terminate()
+            try:
+                proc.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                proc.kill()
+
+    def _call_persistent(
+        self,
+        tool_name: str,
+        arguments: dict,
+        operation: str,
+        test_case: str,
+        iteration: int,
+    ) -> BenchmarkResult:
+        """Call a Playwright MCP tool on the persistent server.
+
+        The first call after start() includes launching the server and is
+        marked as the cold start.
+        """
+        with self._lock:
+            start = time.perf_counter_ns()
+            try:
+                self._ensure_server()
+                response, line = self._request("tools/call", {"name": tool_name, "arguments": arguments})
+                elapsed_ms = ms_since(start)
+            except subprocess.TimeoutExpired:
+                self._shutdown_server()
+                return BenchmarkResult.failure(
+                    self.name, operation, test_case, iteration,
+                    f"Timeout after {self.CALL_TIMEOUT}s", latency_ms=self.CALL_TIMEOUT * 1000,
+                )
+            except Exception as e:
+                self._shutdown_server()
+                return BenchmarkResult.failure(self.name, operation, test_case, iteration, str(e)[:500])
+
+            is_cold = self._cold_start
+            self._cold_start = False
+
+        success = "result" in response
+        return BenchmarkResult(
+            tool=self.name,
+            operation=operation,
+            test_case=test_case,
+            iteration=iteration,
+            latency_ms=elapsed_ms,
+            success=success,
+            is_cold_start=is_cold,
+            payload_size=len(str(response["result"])) if success else 0,
+            token_estimate=estimate_tokens(line),
+            error=None if success else str(response.get("error", "Unknown error"))[:500],
+        )
 
     def _call_mcp(
         self,
@@ -52,18 +251,13 @@ class PlaywrightMCPTool(BrowserTool):
         """Call Playwright MCP tool via stdio.
 
         This spawns a new process for each call, which is the standard
-        MCP stdio usage pattern.
+        MCP stdio usage pattern, unless the tool was created persistent.
         """
         if not self.is_available():
-            return BenchmarkResult(
-                tool=self.name,
-                operation=operation,
-                test_case=test_case,
-                iteration=iteration,
-                latency_ms=0,
-                success=False,
-                error="npx not available",
-            )
+            return BenchmarkResult.failure(self.name, operation, test_case, iteration, "npx not available")
+
+        if self._persistent:
+            return self._call_persistent(tool_name, arguments, operation, test_case, iteration)
 
         # Create MCP request
         request = {
@@ -76,7 +270,7 @@ class PlaywrightMCPTool(BrowserTool):
             },
         }
 
-        start = time.perf_counter()
+        start = time.perf_counter_ns()
         try:
             # Spawn MCP server and send request
             proc = subprocess.Popen(
@@ -84,14 +278,13 @@ class PlaywrightMCPTool(BrowserTool):
                 stdin=subprocess.PIPE,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.PIPE,
-                text=True,
             )
 
             # Send request
-            request_str = json.dumps(request) + "\n"
-            stdout, stderr = proc.communicate(input=request_str, timeout=60)
+            request_bytes = json.dumps(request).encode() + b"\n"
+            stdout, stderr = proc.communicate(input=request_bytes, timeout=60)
 
-            elapsed_ms = (time.perf_counter() - start) * 1000
+            elapsed_ms = ms_since(start)
 
             is_cold = self._cold_start
             self._cold_start = False
@@ -101,23 +294,16 @@ class PlaywrightMCPTool(BrowserTool):
             error = None
             payload_size = 0
 
-            if stdout:
-                try:
-                    # Find JSON response in output
-                    for line in stdout.split("\n"):
-                        if line.strip().startswith("{"):
-                            response = json.loads(line)
-                            if "result" in response:
-                                success = True
-                                payload_size = len(str(response.get("result", "")))
-                            elif "error" in response:
-                                error = str(response["error"])
-                            break
-                except json.JSONDecodeError:
-                    pass
+            response = _find_response(stdout, request["id"]) if stdout else None
+            if response is not None:
+                if "result" in response:
+                    success = True
+                    payload_size = len(str(response["result"]))
+                elif "error" in response:
+                    error = str(response["error"])
 
             if not success and not error:
-                error = stderr[:500] if stderr else "Unknown error"
+                error = stderr[:500].decode("utf-8", "replace") if stderr else "Unknown error"
 
             return BenchmarkResult(
                 tool=self.name,
@@ -128,31 +314,15 @@ class PlaywrightMCPTool(BrowserTool):
                 success=success,
                 is_cold_start=is_cold,
                 payload_size=payload_size,
-                token_estimate=estimate_tokens(stdout or ""),
+                token_estimate=estimate_tokens(stdout),
                 error=error,
             )
 
         except subprocess.TimeoutExpired:
             proc.kill()
-            return BenchmarkResult(
-                tool=self.name,
-                operation=operation,
-                test_case=test_case,
-                iteration=iteration,
-                latency_ms=60000,
-                success=False,
-                error="Timeout after 60s",
-            )
+            return BenchmarkResult.failure(self.name, operation, test_case, iteration, "Timeout after 60s", latency_ms=60000)
         except Exception as e:
-            return BenchmarkResult(
-                tool=self.name,
-                operation=operation,
-                test_case=test_case,
-                iteration=iteration,
-                latency_ms=0,
-                success=False,
-                error=str(e)[:500],
-            )
+            return BenchmarkResult.failure(self.name, operation, test_case, iteration, str(e)[:500])
 
     def navigate(self, url: str, test_case: str = "default", iteration: int = 0, **kwargs) -> BenchmarkResult:
         return self._call_mcp("browser_navigate", {"url": url}, "navigate", test_case, iteration)
@@ -191,11 +361,18 @@ class PlaywrightMCPTool(BrowserTool):
 
     def press_combo(self, modifiers: list[str], key: str, test_case: str = "default", iteration: int = 0, **kwargs) -> BenchmarkResult:
         # Format modifiers for Playwright
-        combo = "+".join(modifiers + [key])
+        combo = key_combo(tuple(modifiers), key)
         return self._call_mcp("browser_press_key", {"key": combo}, "press_combo", test_case, iteration)
 
     def upload(self, selector: str, file_path: str, test_case: str = "default", iteration: int = 0, **kwargs) -> BenchmarkResult:
         return self._call_mcp("browser_file_upload", {"paths": [file_path]}, "upload", test_case, iteration)
 
     def close(self) -> None:
+        with self._lock:
+            self._shutdown_server()
         self._cold_start = True
+
+    def get_pid(self) -> int | None:
+        if self._process is not None and self._process.poll() is None:
+            return self._process.pid
+        return None
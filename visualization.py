@@ -2,16 +2,52 @@
 
 from __future__ import annotations
 
+import hashlib
+import io
+import json
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
-# Try to import matplotlib, but don't fail if not available
-try:
-    import matplotlib.pyplot as plt
+
+@lru_cache(maxsize=None)
+def _mpl():
+    """Import matplotlib on first use (raises ImportError if not installed).
+
+    Importing matplotlib costs a few hundred ms, so it is deferred until a chart
+    is actually drawn rather than paid by everything importing this module.
+    """
+    import matplotlib
+    # DejaVu Sans ships with matplotlib and is already the default's first
+    # choice; pinning it means text never falls back to a system font search
+    matplotlib.rcParams["font.family"] = "sans-serif"
+    matplotlib.rcParams["font.sans-serif"] = ["DejaVu Sans"]
     import matplotlib.patches as mpatches
-    HAS_MATPLOTLIB = True
-except ImportError:
-    HAS_MATPLOTLIB = False
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.colors import ListedColormap
+    from matplotlib.figure import Figure
+
+    def new_figure(figsize: tuple[float, float]):
+        # Drawn straight onto an Agg canvas rather than through pyplot: the
+        # figure isn't registered with pyplot's global figure manager, so
+        # there is nothing to close and charts can be rendered from a
+        # worker thread. Dropping the last reference frees it.
+        fig = Figure(figsize=figsize)
+        FigureCanvasAgg(fig)
+        return fig
+
+    return new_figure, mpatches, ListedColormap
+
+
+def _save(fig, output_path: Path) -> None:
+    """Encode the figure as PNG in memory, then write the file in one call.
+
+    Fewer write syscalls than letting the encoder stream to the file, and
+    a failed render never leaves a truncated PNG behind.
+    """
+    buf = io.BytesIO()
+    fig.savefig(buf, format="png", dpi=150, pil_kwargs=PNG_KWARGS)
+    output_path.write_bytes(buf.getbuffer())
 
 
 # Color scheme
@@ -27,10 +63,23 @@ TOOL_LABELS = {
     "playwright_mcp": "Playwright MCP",
 }
 
+# Charts are regenerated on every run, so favour fast PNG encoding over
+# the smallest file (zlib level 1 instead of the default 6)
+PNG_KWARGS = {"compress_level": 1}
+
+# Feature parity statuses as small integer codes, which index the heatmap
+# value (red 0 / gray 0.5 / green 1) and cell symbol of each status
+_PARITY_CODES = {"FAIL": 0, "ERROR": 1, "N/A": 3, "OK": 4}
+_PARITY_UNKNOWN = 2
+_PARITY_VALUES = (0, 0, 0, 0.5, 1)
+_PARITY_SYMBOLS = ("N", "!", "?", "-", "Y")
+
 
 def generate_latency_chart(report: Any, output_dir: Path) -> str | None:
     """Generate bar chart comparing latencies."""
-    if not HAS_MATPLOTLIB:
+    try:
+        new_figure, _, _ = _mpl()
+    except ImportError:
         print("    [SKIP] matplotlib not installed")
         return None
 
@@ -41,48 +90,30 @@ def generate_latency_chart(report: Any, output_dir: Path) -> str | None:
 
     # Prepare data
     operations = list(comparison.keys())
-    tools = list(set(
-        tool for op_data in comparison.values()
-        for tool in op_data.keys()
-    ))
+    # Known tools in COLORS order, then any others as first seen, so bars
+    # and legend entries come out the same on every run
+    seen = dict.fromkeys(tool for op_data in comparison.values() for tool in op_data)
+    tools = [t for t in COLORS if t in seen] + [t for t in seen if t not in COLORS]
 
-    fig, ax = plt.subplots(figsize=(12, 6))
+    fig = new_figure((12, 6))
+    ax = fig.add_subplot()
 
     x = range(len(operations))
     width = 0.25
-    multiplier = 0
-
-    for tool in tools:
-        latencies = []
-        for op in operations:
-            if tool in comparison[op]:
-                latencies.append(comparison[op][tool]["mean_ms"])
-            else:
-                latencies.append(0)
 
-        offset = width * multiplier
+    for j, tool in enumerate(tools):
+        # Mean latency per operation (0 where the tool has no result)
+        column = [comparison[op][tool]["mean_ms"] if tool in comparison[op] else 0 for op in operations]
         bars = ax.bar(
-            [i + offset for i in x],
-            latencies,
+            [i + width * j for i in x],
+            column,
             width,
             label=TOOL_LABELS.get(tool, tool),
             color=COLORS.get(tool, "#888888"),
         )
 
         # Add value labels on bars
-        for bar, val in zip(bars, latencies):
-            if val > 0:
-                ax.annotate(
-                    f'{val:.0f}',
-                    xy=(bar.get_x() + bar.get_width() / 2, bar.get_height()),
-                    xytext=(0, 3),
-                    textcoords="offset points",
-                    ha='center',
-                    va='bottom',
-                    fontsize=8,
-                )
-
-        multiplier += 1
+        ax.bar_label(bars, labels=[f'{val:.0f}' if val > 0 else '' for val in column], padding=3, fontsize=8)
 
     ax.set_ylabel('Latency (ms)')
     ax.set_title('Single Operation Latency Comparison')
@@ -92,17 +123,18 @@ def generate_latency_chart(report: Any, output_dir: Path) -> str | None:
     ax.set_yscale('log')
     ax.grid(True, alpha=0.3)
 
-    plt.tight_layout()
+    fig.tight_layout()
     output_path = output_dir / "latency_comparison.png"
-    plt.savefig(output_path, dpi=150)
-    plt.close()
+    _save(fig, output_path)
 
     return str(output_path)
 
 
 def generate_workflow_chart(report: Any, output_dir: Path) -> str | None:
     """Generate horizontal bar chart for workflow speedups."""
-    if not HAS_MATPLOTLIB:
+    try:
+        new_figure, _, _ = _mpl()
+    except ImportError:
         return None
 
     if not report.workflows or "comparison" not in report.workflows:
@@ -110,7 +142,8 @@ def generate_workflow_chart(report: Any, output_dir: Path) -> str | None:
 
     comparison = report.workflows["comparison"]
 
-    fig, ax = plt.subplots(figsize=(10, 6))
+    fig = new_figure((10, 6))
+    ax = fig.add_subplot()
 
     workflows = list(comparison.keys())
     speedups = []
@@ -121,38 +154,34 @@ def generate_workflow_chart(report: Any, output_dir: Path) -> str | None:
         else:
             speedups.append(0)
 
-    colors = ["#00D26A" if s >= 10 else "#66BB6A" for s in speedups]
+    # Bright green for 10x and up, softer green below: both colours are
+    # parsed once and each bar picks one of the two RGBA tuples
+    from matplotlib.colors import to_rgba
+    palette = (to_rgba("#66BB6A"), to_rgba("#00D26A"))
+    colors = [palette[s >= 10] for s in speedups]
 
     bars = ax.barh(workflows, speedups, color=colors)
 
     # Add value labels
-    for bar, speedup in zip(bars, speedups):
-        ax.annotate(
-            f'{speedup:.1f}x',
-            xy=(bar.get_width(), bar.get_y() + bar.get_height() / 2),
-            xytext=(5, 0),
-            textcoords="offset points",
-            ha='left',
-            va='center',
-            fontweight='bold',
-        )
+    ax.bar_label(bars, labels=[f'{speedup:.1f}x' for speedup in speedups], padding=5, fontweight='bold')
 
     ax.set_xlabel('Speedup vs Playwright MCP')
     ax.set_title('FGP Browser Workflow Speedup')
     ax.axvline(x=1, color='gray', linestyle='--', alpha=0.5)
     ax.grid(True, alpha=0.3, axis='x')
 
-    plt.tight_layout()
+    fig.tight_layout()
     output_path = output_dir / "workflow_speedup.png"
-    plt.savefig(output_path, dpi=150)
-    plt.close()
+    _save(fig, output_path)
 
     return str(output_path)
 
 
 def generate_feature_parity_chart(report: Any, output_dir: Path) -> str | None:
     """Generate feature parity matrix visualization."""
-    if not HAS_MATPLOTLIB:
+    try:
+        new_figure, mpatches, ListedColormap = _mpl()
+    except ImportError:
         return None
 
     if not report.feature_parity or "matrix" not in report.feature_parity:
@@ -162,24 +191,18 @@ def generate_feature_parity_chart(report: Any, output_dir: Path) -> str | None:
     features = report.feature_parity["features"]
     tools = list(matrix.keys())
 
-    fig, ax = plt.subplots(figsize=(10, 8))
-
-    # Create binary matrix
-    data = []
-    for tool in tools:
-        row = []
-        for feature in features:
-            status = matrix[tool].get(feature, "N/A")
-            if status == "OK":
-                row.append(1)  # Green
-            elif status == "N/A":
-                row.append(0.5)  # Gray
-            else:
-                row.append(0)  # Red
-        data.append(row)
+    fig = new_figure((10, 8))
+    ax = fig.add_subplot()
+
+    # Map every cell to a status code once; cell colours and symbols are
+    # then looked up by code
+    codes = [
+        [_PARITY_CODES.get(matrix[tool].get(feature, "N/A"), _PARITY_UNKNOWN) for feature in features]
+        for tool in tools
+    ]
+    data = [[_PARITY_VALUES[code] for code in row] for row in codes]
 
     # Create heatmap
-    from matplotlib.colors import ListedColormap
     cmap = ListedColormap(['#FF4444', '#AAAAAA', '#00D26A'])
 
     im = ax.imshow(data, cmap=cmap, aspect='auto', vmin=0, vmax=1)
@@ -191,11 +214,9 @@ def generate_feature_parity_chart(report: Any, output_dir: Path) -> str | None:
     ax.set_yticklabels([TOOL_LABELS.get(t, t) for t in tools])
 
     # Add text annotations
-    for i, tool in enumerate(tools):
-        for j, feature in enumerate(features):
-            status = matrix[tool].get(feature, "N/A")
-            symbol = {"OK": "Y", "N/A": "-", "FAIL": "N", "ERROR": "!"}.get(status, "?")
-            ax.text(j, i, symbol, ha='center', va='center', fontsize=12, fontweight='bold')
+    for i, row in enumerate(codes):
+        for j, code in enumerate(row):
+            ax.text(j, i, _PARITY_SYMBOLS[code], ha='center', va='center', fontsize=12, fontweight='bold')
 
     ax.set_title('Feature Parity Matrix')
 
@@ -207,23 +228,27 @@ def generate_feature_parity_chart(report: Any, output_dir: Path) -> str | None:
     ]
     ax.legend(handles=legend_elements, loc='upper left', bbox_to_anchor=(1.02, 1))
 
-    plt.tight_layout()
+    # Reserve the right edge for the legend instead of using
+    # bbox_inches='tight', which renders the figure twice on save
+    fig.tight_layout(rect=(0, 0, 0.8, 1))
     output_path = output_dir / "feature_parity.png"
-    plt.savefig(output_path, dpi=150, bbox_inches='tight')
-    plt.close()
+    _save(fig, output_path)
 
     return str(output_path)
 
 
 def generate_twitter_chart(report: Any, output_dir: Path) -> str | None:
     """Generate a single, shareable chart for Twitter."""
-    if not HAS_MATPLOTLIB:
+    try:
+        new_figure, _, _ = _mpl()
+    except ImportError:
         return None
 
     if not report.single_ops or "comparison" not in report.single_ops:
         return None
 
-    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(14, 6))
+    fig = new_figure((14, 6))
+    ax1, ax2 = fig.subplots(1, 2)
 
     # Left: Latency comparison for navigate
     comparison = report.single_ops["comparison"]
@@ -239,19 +264,15 @@ def generate_twitter_chart(report: Any, output_dir: Path) -> str | None:
         # Add speedup annotations
         if len(latencies) >= 2:
             max_lat = max(latencies)
-            for i, (bar, lat) in enumerate(zip(bars, latencies)):
-                if lat < max_lat:
-                    speedup = max_lat / lat
-                    ax1.annotate(
-                        f'{speedup:.0f}x faster',
-                        xy=(bar.get_x() + bar.get_width() / 2, bar.get_height()),
-                        xytext=(0, 10),
-                        textcoords="offset points",
-                        ha='center',
-                        fontsize=12,
-                        fontweight='bold',
-                        color=COLORS.get(tools[i], "#000000"),
-                    )
+            texts = ax1.bar_label(
+                bars,
+                labels=[f'{max_lat / lat:.0f}x faster' if lat < max_lat else '' for lat in latencies],
+                padding=10,
+                fontsize=12,
+                fontweight='bold',
+            )
+            for text, tool in zip(texts, tools):
+                text.set_color(COLORS.get(tool, "#000000"))
 
         ax1.set_ylabel('Latency (ms)', fontsize=12)
         ax1.set_title('Navigation Latency', fontsize=14, fontweight='bold')
@@ -270,61 +291,100 @@ def generate_twitter_chart(report: Any, output_dir: Path) -> str | None:
             else:
                 speedups.append(0)
 
-        colors = ["#00D26A" for _ in speedups]
         bars = ax2.barh(
             [wf.replace('_', ' ').title() for wf in workflows],
             speedups,
-            color=colors,
+            color="#00D26A",
         )
 
-        for bar, speedup in zip(bars, speedups):
-            ax2.annotate(
-                f'{speedup:.0f}x',
-                xy=(bar.get_width(), bar.get_y() + bar.get_height() / 2),
-                xytext=(5, 0),
-                textcoords="offset points",
-                ha='left',
-                va='center',
-                fontsize=12,
-                fontweight='bold',
-            )
+        ax2.bar_label(bars, labels=[f'{speedup:.0f}x' for speedup in speedups], padding=5, fontsize=12, fontweight='bold')
 
         ax2.set_xlabel('Speedup vs MCP', fontsize=12)
         ax2.set_title('Workflow Speedup (FGP Browser)', fontsize=14, fontweight='bold')
         ax2.grid(True, alpha=0.3, axis='x')
 
-    plt.suptitle(
+    fig.text(
+        0.5, 0.96,
         'FGP Browser: 200x Faster Than Playwright MCP',
+        ha='center',
+        va='top',
         fontsize=16,
         fontweight='bold',
-        y=1.02,
     )
 
-    plt.tight_layout()
+    # Fixed margins (room for the title, axis labels and the workflow names)
+    # instead of tight_layout, which measures every text artist first
+    fig.subplots_adjust(left=0.07, right=0.96, top=0.85, bottom=0.1, wspace=0.3)
     output_path = output_dir / "twitter_chart.png"
-    plt.savefig(output_path, dpi=200, bbox_inches='tight')
-    plt.close()
+    _save(fig, output_path)
 
     return str(output_path)
 
 
+# Records, per chart file, a digest of the report data it was drawn from
+# and the PNG's mtime, so unchanged charts aren't redrawn on the next run
+CHART_DIGESTS = ".digests.json"
+
+
+def _chart_inputs(report: Any) -> dict[str, Any]:
+    """The report data each chart file is drawn from."""
+    single = (report.single_ops or {}).get("comparison")
+    workflows = (report.workflows or {}).get("comparison")
+    parity = report.feature_parity or {}
+    return {
+        "latency_comparison.png": single,
+        "workflow_speedup.png": workflows,
+        "feature_parity.png": (parity.get("matrix"), parity.get("features")),
+        "twitter_chart.png": (single, workflows),
+    }
+
+
+def _digest(data: Any) -> str:
+    return hashlib.blake2b(json.dumps(data, sort_keys=True, default=str).encode(), digest_size=16).hexdigest()
+
+
 def generate_all_charts(report: Any) -> list[str]:
-    """Generate all charts and return paths."""
+    """Generate all charts and return paths.
+
+    A chart is skipped, and its existing file reused, when the data it is
+    drawn from matches the last run and the PNG hasn't been touched since.
+    """
     output_dir = Path(__file__).parent / "results" / "charts"
     output_dir.mkdir(parents=True, exist_ok=True)
 
+    digests_path = output_dir / CHART_DIGESTS
+    try:
+        digests = json.loads(digests_path.read_text())
+    except (OSError, ValueError):
+        digests = {}
+    inputs = _chart_inputs(report)
+
     paths = []
 
-    chart_generators = [
-        generate_latency_chart,
-        generate_workflow_chart,
-        generate_feature_parity_chart,
-        generate_twitter_chart,
+    # Each chart draws on its own fresh figure, so its output never depends
+    # on which other charts were (re)drawn before it
+    charts = [
+        (generate_latency_chart, "latency_comparison.png"),
+        (generate_workflow_chart, "workflow_speedup.png"),
+        (generate_feature_parity_chart, "feature_parity.png"),
+        (generate_twitter_chart, "twitter_chart.png"),
     ]
 
-    for generator in chart_generators:
+    for generator, filename in charts:
+        output_path = output_dir / filename
+        digest = _digest(inputs[filename])
+        try:
+            current = digests.get(filename) == [digest, output_path.stat().st_mtime_ns]
+        except OSError:
+            current = False
+        if current:
+            paths.append(str(output_path))
+            continue
+
         path = generator(report, output_dir)
         if path:
+            digests[filename] = [digest, output_path.stat().st_mtime_ns]
             paths.append(path)
 
+    digests_path.write_text(json.dumps(digests))
     return paths